@@ -0,0 +1,14 @@
+# conftest.py
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def usage_manager(tmp_path_factory):
+    """APIUsageManager backed by a throwaway usage file, shared per test module"""
+    from job_scrapers.api_usage_manager import APIUsageManager
+
+    usage_file = tmp_path_factory.mktemp("usage") / "test_usage.json"
+    manager = APIUsageManager(str(usage_file), autosave=False)
+    yield manager
+    manager.flush()
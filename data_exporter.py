@@ -8,7 +8,7 @@ import os
 import csv
 import sqlite3
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 class JobDataExporter:
     """Handles exporting job data to various formats"""
@@ -41,6 +41,22 @@ class JobDataExporter:
         Returns:
             List[Dict]: List of job dictionaries
         """
+        columns, rows = self._query_jobs(limit, source, days_back)
+        return [dict(zip(columns, row)) for row in rows]
+    
+    def _query_jobs(self, limit: Optional[int] = None, source: Optional[str] = None,
+                    days_back: Optional[int] = None) -> Tuple[List[str], List[tuple]]:
+        """
+        Run the filtered jobs query and return raw row tuples.
+        
+        Args:
+            limit (int, optional): Maximum number of jobs to retrieve
+            source (str, optional): Filter by job source (e.g., 'adzuna', 'jsearch')
+            days_back (int, optional): Only get jobs from last N days
+            
+        Returns:
+            Tuple[List[str], List[tuple]]: Column names and row tuples
+        """
         conn = self._get_database_connection()
         cursor = conn.cursor()
         
@@ -69,14 +85,10 @@ class JobDataExporter:
         
         cursor.execute(query, params)
         columns = [description[0] for description in cursor.description]
-        
-        jobs = []
-        for row in cursor.fetchall():
-            job_dict = dict(zip(columns, row))
-            jobs.append(job_dict)
+        rows = cursor.fetchall()
         
         conn.close()
-        return jobs
+        return columns, rows
     
     def export_to_csv(self, filename: Optional[str] = None, **kwargs) -> str:
         """
@@ -98,21 +110,20 @@ class JobDataExporter:
         if not filename.endswith('.csv'):
             filename += '.csv'
         
-        # Get data from database
-        jobs_data = self.get_jobs_data(**kwargs)
+        # Get data from database as row tuples; csv.writer needs no per-row dicts
+        columns, rows = self._query_jobs(**kwargs)
         
-        if not jobs_data:
+        if not rows:
             print("No jobs found to export")
             return ""
         
         # Write to CSV
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = jobs_data[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(jobs_data)
+            writer = csv.writer(csvfile)
+            writer.writerow(columns)
+            writer.writerows(rows)
         
-        print(f"Exported {len(jobs_data)} jobs to {filename}")
+        print(f"Exported {len(rows)} jobs to {filename}")
         return filename
     
     def export_to_excel(self, filename: Optional[str] = None, **kwargs) -> str:
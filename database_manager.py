@@ -19,7 +19,7 @@ class JobApplicationDB:
                 schema = f.read()
 
             # Connect and create tables
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = self._connect()
             self.conn.executescript(schema)
             self.conn.commit()
             print(f"Database initialized at {self.db_path}")
@@ -28,17 +28,26 @@ class JobApplicationDB:
             print(f"Error creating database: {str(e)}")
             raise
 
+    def _connect(self):
+        """Open a connection configured for fast writes"""
+        conn = sqlite3.connect(self.db_path)
+        # WAL lets readers and the writer work concurrently and, with
+        # synchronous=NORMAL, avoids an fsync on every commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def ensure_connection(self):
         """Ensure database connection is valid, reconnect if needed"""
         try:
             if self.conn is None:
-                self.conn = sqlite3.connect(self.db_path)
+                self.conn = self._connect()
             else:
                 # Test the connection
                 self.conn.execute("SELECT 1")
         except sqlite3.Error:
             # Connection is bad, recreate it
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = self._connect()
 
     # Original job-related methods
     def add_job(self, job_data):
@@ -106,6 +115,72 @@ class JobApplicationDB:
             self.conn.rollback()
             raise
 
+    def add_jobs_bulk(self, jobs, source):
+        """
+        Add or update many jobs in a single transaction.
+        
+        Behaves like calling add_job for each job, but uses one executemany
+        upsert and a single commit instead of a round-trip per job.
+        
+        Args:
+            jobs (list): Job dictionaries
+            source (str): Job source stored with every job
+            
+        Returns:
+            int: Number of jobs written
+        """
+        if not jobs:
+            return 0
+        
+        try:
+            self.ensure_connection()
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
+            with self.conn:
+                cursor = self.conn.cursor()
+                
+                # Take the write lock before reading the maximum id, so no other
+                # connection can insert jobs between that read and the inserts
+                # below (sqlite3 would otherwise only BEGIN at the first INSERT)
+                cursor.execute("BEGIN IMMEDIATE")
+                
+                # Jobs inserted below get ids above the current maximum
+                cursor.execute("SELECT COALESCE(MAX(id), 0) FROM jobs")
+                last_id = cursor.fetchone()[0]
+                
+                cursor.executemany("""
+                    INSERT INTO jobs (
+                        job_source_id, source, title, company, location,
+                        salary, url, tags, date_posted, date_found,
+                        description, is_remote
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(job_source_id, source) DO UPDATE SET
+                        title = excluded.title, company = excluded.company,
+                        location = excluded.location, salary = excluded.salary,
+                        url = excluded.url, tags = excluded.tags,
+                        date_posted = excluded.date_posted,
+                        description = excluded.description,
+                        is_remote = excluded.is_remote
+                """, [(
+                    job['id'], source, job['title'],
+                    job['company'], job['location'], job['salary'],
+                    job['url'], job['tags'], job['posted'], now,
+                    job.get('description', ''),
+                    'Remote' in job['location']
+                ) for job in jobs])
+                
+                # Create initial application entries for the new jobs only
+                cursor.execute("""
+                    INSERT INTO applications (job_id, status, last_updated)
+                    SELECT id, 'New', ? FROM jobs WHERE id > ?
+                """, (now, last_id))
+            
+            return len(jobs)
+
+        except Exception as e:
+            print(f"Error adding jobs: {str(e)}")
+            raise
+
     def update_application_status(self, job_id, status, notes=None):
         """Update the status of a job application"""
         try:
@@ -127,6 +202,26 @@ class JobApplicationDB:
             self.conn.rollback()
             raise
 
+    def get_all_job_ids(self, source):
+        """
+        Get the source-side ids of every stored job from a source.
+        
+        Args:
+            source (str): Job source, as stored in the jobs table
+            
+        Returns:
+            set: job_source_id values already in the database
+        """
+        try:
+            self.ensure_connection()
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT job_source_id FROM jobs WHERE source = ?", (source,))
+            return {row[0] for row in cursor.fetchall()}
+
+        except Exception as e:
+            print(f"Error getting job ids: {str(e)}")
+            raise
+
     def get_all_applications(self):
         """Get all job applications with their current status"""
         try:
@@ -344,6 +439,31 @@ class JobApplicationDB:
             print(f"Error getting email templates: {str(e)}")
             raise
 
+    def get_email_template_by_name(self, name):
+        """Get the best-performing email template with a name, or None if there is none"""
+        try:
+            self.ensure_connection()
+            cursor = self.conn.cursor()
+            
+            cursor.execute("""
+                SELECT id, name, subject, body, use_case, variables, success_rate
+                FROM email_templates
+                WHERE name = ?
+                ORDER BY success_rate DESC
+                LIMIT 1
+            """, (name,))
+            
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            
+            columns = ['id', 'name', 'subject', 'body', 'use_case', 'variables', 'success_rate']
+            return dict(zip(columns, row))
+
+        except Exception as e:
+            print(f"Error getting email template: {str(e)}")
+            raise
+
     # Outreach tracking methods
     def track_outreach_message(self, message_data):
         """Track an outreach message sent to a contact"""
@@ -430,4 +550,11 @@ class JobApplicationDB:
     def close(self):
         """Close the database connection"""
         if self.conn:
-            self.conn.close()
\ No newline at end of file
+            try:
+                # Copy the write-ahead log back into the .db file, so a copied
+                # or committed database holds every write without its -wal file
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                print(f"Could not checkpoint database: {str(e)}")
+            self.conn.close()
+            self.conn = None
\ No newline at end of file
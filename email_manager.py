@@ -1,5 +1,6 @@
 # email_manager.py
 
+import re
 import smtplib
 import time
 from email.mime.text import MIMEText
@@ -8,6 +9,9 @@ from datetime import datetime, timedelta
 from config import Config
 import json
 
+# Matches {{variable}} placeholders in email templates
+_VAR_RE = re.compile(r'\{\{(\w+)\}\}')
+
 class EmailManager:
     def __init__(self, db_instance):
         self.db = db_instance
@@ -33,8 +37,7 @@ class EmailManager:
         """Create an email message using a template"""
         try:
             # Get the template
-            templates = self.db.get_email_templates()
-            template = next((t for t in templates if t['name'] == template_name), None)
+            template = self.db.get_email_template_by_name(template_name)
             
             if not template:
                 raise ValueError(f"Template '{template_name}' not found")
@@ -48,14 +51,13 @@ class EmailManager:
             if custom_variables:
                 variables.update(custom_variables)
             
-            # Replace variables in template
-            subject = template['subject']
-            body = template['body']
+            # Replace all variables in one pass; unknown placeholders are left as-is
+            def substitute(match):
+                var_name = match.group(1)
+                return str(variables[var_name]) if var_name in variables else match.group(0)
             
-            for var_name, var_value in variables.items():
-                placeholder = f"{{{{{var_name}}}}}"
-                subject = subject.replace(placeholder, str(var_value))
-                body = body.replace(placeholder, str(var_value))
+            subject = _VAR_RE.sub(substitute, template['subject'])
+            body = _VAR_RE.sub(substitute, template['body'])
             
             return {
                 'subject': subject,
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import argparse
 import json
+import logging
 import os
 from dotenv import load_dotenv
 from job_scrapers.scraper_coordinator import JobScraperCoordinator
@@ -8,12 +9,8 @@ from job_scrapers.scraper_factory import JobScraperFactory
 from job_scrapers.api_usage_manager import APIUsageManager
 from data_exporter import JobDataExporter
 
-def main():
-    """Main CLI entry point for job scraper"""
-    # Load environment variables
-    load_dotenv()
-    
-    # Parse command-line arguments
+def create_parser():
+    """Build the command-line argument parser for the job scraper"""
     parser = argparse.ArgumentParser(description='Job Application Bot - Job Scraper')
     
     # Platform selection arguments
@@ -79,7 +76,18 @@ def main():
     debug_group.add_argument('--debug', action='store_true',
                           help='Enable debug output')
     
-    args = parser.parse_args()
+    return parser
+
+def main():
+    """Main CLI entry point for job scraper"""
+    # Load environment variables
+    load_dotenv()
+    
+    # Show scraper progress messages; set LOG_LEVEL=DEBUG for per-page detail
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(), format='%(message)s')
+    
+    # Parse command-line arguments
+    args = create_parser().parse_args()
     
     # Handle information requests
     if args.quota_status:
@@ -108,13 +116,12 @@ def main():
         return
     
     if args.list_sources or args.list_platforms:
-        available_scrapers = JobScraperFactory.get_available_scrapers()
         print("\nAvailable Job Sources:")
         print("=" * 60)
         
         # Group by type
-        api_scrapers = {k: v for k, v in available_scrapers.items() if v.get('type') == 'api'}
-        web_scrapers = {k: v for k, v in available_scrapers.items() if v.get('type') == 'web'}
+        api_scrapers = JobScraperFactory.get_scrapers_by_type('api')
+        web_scrapers = JobScraperFactory.get_scrapers_by_type('web')
         
         if api_scrapers:
             print("\nAPI Scrapers (Recommended):")
@@ -2,7 +2,6 @@ import re
 from datetime import datetime
 from urllib.parse import urlencode
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
 
@@ -170,7 +169,7 @@ class AdzunaScraper(BaseJobScraper):
         """Extract all jobs from current page"""
         try:
             print("Waiting for Adzuna job listings to load...")
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".Jobentry, .jcs-JobContainer"))
             )
             
@@ -209,10 +208,10 @@ class AdzunaScraper(BaseJobScraper):
         try:
             print(f"Navigating to next Adzuna page: {next_url}")
             self.driver.get(next_url)
-            self.human_like_delay(3, 5)
+            self.wait_for_page_load()
             
             # Wait for new results to load
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".Jobentry, .jcs-JobContainer"))
             )
             
@@ -1,19 +1,24 @@
 import json
 import os
+import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
 class APIUsageManager:
     """Manages API quotas, usage tracking, and smart source selection"""
     
-    def __init__(self, usage_file="jsearch_usage.json"):
+    def __init__(self, usage_file="jsearch_usage.json", autosave=True):
         """
         Initialize the API usage manager.
         
         Args:
             usage_file (str): Path to the usage tracking file
+            autosave (bool): Write the usage file on every change; when False,
+                changes are kept in memory until flush() is called
         """
         self.usage_file = usage_file
+        self.autosave = autosave
+        self._dirty = False
         self.usage_data = self._load_usage_data()
         
         # API Limits (monthly)
@@ -29,6 +34,20 @@ class APIUsageManager:
             'linkedin_specific': ['linkedin', 'premium'],
             'company_specific': ['google', 'facebook', 'amazon', 'microsoft', 'apple']
         }
+        
+        # Technology keywords that make a query medium priority
+        self.tech_keywords = ['react', 'nodejs', 'python', 'frontend', 'backend', 'fullstack']
+        
+        # Compile the keyword lists once; matching is a plain substring search
+        self._high_pattern = self._compile_keywords(
+            keyword for keywords in self.query_priorities.values() for keyword in keywords
+        )
+        self._medium_pattern = self._compile_keywords(self.tech_keywords)
+    
+    @staticmethod
+    def _compile_keywords(keywords) -> re.Pattern:
+        """Compile keywords into a single case-insensitive alternation pattern"""
+        return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
     
     def _load_usage_data(self) -> Dict:
         """Load usage data from file"""
@@ -45,10 +64,23 @@ class APIUsageManager:
         }
     
     def _save_usage_data(self):
-        """Save usage data to file"""
+        """Save usage data to file, or mark it for the next flush()"""
+        if not self.autosave:
+            self._dirty = True
+            return
+        self._write_usage_data()
+    
+    def flush(self):
+        """Write pending usage changes to file"""
+        if self._dirty:
+            self._write_usage_data()
+    
+    def _write_usage_data(self):
+        """Write usage data to file"""
         try:
             with open(self.usage_file, 'w') as f:
                 json.dump(self.usage_data, f, indent=2)
+            self._dirty = False
         except Exception as e:
             print(f"Warning: Could not save usage data: {e}")
     
@@ -131,21 +163,29 @@ class APIUsageManager:
         Returns:
             str: Priority level ('high', 'medium', 'low')
         """
-        query_lower = query.lower()
-        
         # High priority: senior roles, salary research, company-specific
-        for priority_type, keywords in self.query_priorities.items():
-            if any(keyword in query_lower for keyword in keywords):
-                return 'high'
+        if self._high_pattern.search(query):
+            return 'high'
         
         # Medium priority: specific technologies or roles
-        tech_keywords = ['react', 'nodejs', 'python', 'frontend', 'backend', 'fullstack']
-        if any(keyword in query_lower for keyword in tech_keywords):
+        if self._medium_pattern.search(query):
             return 'medium'
         
         # Low priority: broad searches
         return 'low'
     
+    def classify_batch(self, queries: List[str]) -> List[str]:
+        """
+        Classify several queries at once.
+        
+        Args:
+            queries (List[str]): The search queries
+            
+        Returns:
+            List[str]: Priority level for each query, in order
+        """
+        return [self.classify_query_priority(query) for query in queries]
+    
     def get_optimal_api_strategy(self, query: str, platforms: List[str], max_results: int = 50) -> List[Tuple[str, str, int]]:
         """
         Get optimal API usage strategy for a query.
@@ -1,8 +1,10 @@
 import os
+import socket
 import time
 import random
 import csv
 from datetime import datetime
+from operator import itemgetter
 from abc import ABC, abstractmethod
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -14,9 +16,27 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 from database_manager import JobApplicationDB
 
+# Address of a long-lived Chrome started with --remote-debugging-port (see
+# launch_browser.sh), e.g. 127.0.0.1:9222. Unset by default, so every scraper
+# launches its own browser unless attaching is opted into
+DEBUGGER_ADDRESS = os.getenv('CHROME_DEBUGGER_ADDRESS', '')
+
+# Seconds between condition checks in explicit waits (Selenium defaults to 0.5)
+WAIT_POLL_FREQUENCY = 0.05
+
+# Scrapers that don't need a manual login run headless unless CHROME_HEADLESS=0
+HEADLESS = os.getenv('CHROME_HEADLESS', '1') != '0'
+
+# Static assets that never carry job data; blocked through the DevTools protocol
+BLOCKED_URL_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.woff', '*.woff2',
+                        '*googletagmanager*', '*google-analytics*', '*fonts.googleapis*']
+
 class BaseJobScraper(ABC):
     """Abstract base class for all job scrapers."""
     
+    # Job fields kept for internal use that are left out of the CSV backup
+    _CSV_EXCLUDED_FIELDS = frozenset()
+    
     def __init__(self, source_name, requires_login=False, db_instance=None, scraper_type="web"):
         """
         Initialize a job scraper.
@@ -28,18 +48,60 @@ class BaseJobScraper(ABC):
             scraper_type (str): Type of scraper ("web" or "api")
         """
         self.driver = None
+        self.attached_to_browser = False
         self.jobs_data = []
+        # Ids of jobs already written to the database during this run
+        self._stored_ids = set()
         self.db = db_instance if db_instance else JobApplicationDB()
         self.source_name = source_name
         self.requires_login = requires_login
         self.scraper_type = scraper_type
         
+    def _debugger_available(self):
+        """Check whether a Chrome debugging endpoint is listening at DEBUGGER_ADDRESS"""
+        if not DEBUGGER_ADDRESS:
+            return False
+        host, _, port = DEBUGGER_ADDRESS.rpartition(':')
+        try:
+            with socket.create_connection((host or '127.0.0.1', int(port)), timeout=0.2):
+                return True
+        except (OSError, ValueError):
+            return False
+    
+    def _attach_to_browser(self):
+        """
+        Attach to an already running Chrome instead of launching a new one.
+        
+        The scraper works in its own tab so cleanup can close just that tab
+        and leave the browser running for the next run.
+        
+        Returns:
+            bool: True if attached successfully
+        """
+        try:
+            options = webdriver.ChromeOptions()
+            options.debugger_address = DEBUGGER_ADDRESS
+            self.driver = webdriver.Chrome(options=options)
+            self.driver.switch_to.new_window('tab')
+            self.attached_to_browser = True
+            self._configure_driver()
+            print(f"Attached to running browser at {DEBUGGER_ADDRESS} for {self.source_name}")
+            return True
+        except Exception as e:
+            print(f"Could not attach to browser at {DEBUGGER_ADDRESS}: {str(e)}")
+            self.driver = None
+            return False
+    
     def setup_driver(self):
         """Initialize and configure the Chrome driver with anti-detection measures."""
         # Skip driver setup for API scrapers
         if self.scraper_type == "api":
             return True
         
+        # Reuse a long-lived browser when one is running, saving the Chrome startup
+        if self._debugger_available() and self._attach_to_browser():
+            return True
+        
         try:
             options = webdriver.ChromeOptions()
             
@@ -54,6 +116,8 @@ class BaseJobScraper(ABC):
             options.add_argument('--disable-extensions-file-access-check')
             options.add_argument('--disable-extensions')
             options.add_argument('--disable-plugins-discovery')
+            if HEADLESS and not self.requires_login:
+                options.add_argument('--headless=new')
             
             # Handle Windows Chrome executable paths
             import platform
@@ -81,6 +145,8 @@ class BaseJobScraper(ABC):
                 "profile.default_content_setting_values.notifications": 2,
                 "profile.default_content_settings.popups": 0,
                 "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+                "profile.managed_default_content_settings.media_stream": 2,
                 "profile.default_content_setting_values.geolocation": 2
             }
             options.add_experimental_option("prefs", prefs)
@@ -89,7 +155,7 @@ class BaseJobScraper(ABC):
             try:
                 # Try fallback method first (it's working)
                 self.driver = webdriver.Chrome(options=options)
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                self._configure_driver()
                 
                 print(f"Browser setup successful for {self.source_name}")
                 return True
@@ -99,7 +165,7 @@ class BaseJobScraper(ABC):
                 try:
                     service = Service(ChromeDriverManager().install())
                     self.driver = webdriver.Chrome(service=service, options=options)
-                    self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                    self._configure_driver()
                     
                     print(f"Browser setup successful for {self.source_name} (webdriver-manager)")
                     return True
@@ -111,6 +177,15 @@ class BaseJobScraper(ABC):
             print(f"Error setting up browser: {str(e)}")
             return False
     
+    def _configure_driver(self):
+        """Hide the webdriver flag and block static assets on a new or attached driver"""
+        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            print(f"Could not block static assets: {str(e)}")
+    
     def check_for_bot_detection(self):
         """Check if page has bot detection and handle gracefully"""
         try:
@@ -137,6 +212,37 @@ class BaseJobScraper(ABC):
     def human_like_delay(self, min_seconds=2, max_seconds=5):
         """Add random delay to mimic human behavior."""
         time.sleep(random.uniform(min_seconds, max_seconds))
+    
+    def wait(self, timeout=15):
+        """
+        Create an explicit wait that polls quickly, so a condition that is met
+        early is noticed within ~50ms rather than the default 500ms.
+        
+        Args:
+            timeout (int): Maximum seconds to wait
+            
+        Returns:
+            WebDriverWait: Wait bound to this scraper's driver
+        """
+        return WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+    
+    def wait_for_page_load(self, timeout=15):
+        """
+        Wait until the current page has finished loading, plus a short jitter.
+        
+        Use this after driver.get() instead of a fixed sleep; it returns as
+        soon as the document is ready.
+        
+        Args:
+            timeout (int): Maximum number of seconds to wait
+        """
+        try:
+            self.wait(timeout).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            print(f"Page load timed out after {timeout}s, continuing")
+        self.human_like_delay(0.2, 0.8)
         
     def save_jobs(self):
         """Save jobs to both database and CSV."""
@@ -151,34 +257,66 @@ class BaseJobScraper(ABC):
             # Save to CSV using built-in csv module
             if self.jobs_data:
                 with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    fieldnames = self.jobs_data[0].keys()
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(self.jobs_data)
+                    fieldnames = [field for field in self.jobs_data[0]
+                                  if field not in self._CSV_EXCLUDED_FIELDS]
+                    # Rows from one scraper share their keys, so plain tuples
+                    # skip DictWriter's per-row key checks
+                    writer = csv.writer(csvfile)
+                    writer.writerow(fieldnames)
+                    writer.writerows(map(itemgetter(*fieldnames), self.jobs_data))
                 print(f"\nSaved {len(self.jobs_data)} jobs to {filename}")
             
-            # Save to database
-            db_saved_count = 0
-            for job in self.jobs_data:
-                # Add source information
-                job['source'] = self.source_name.lower()
-                
-                # Save to database
-                self.db.add_job(job)
-                db_saved_count += 1
+            # Pages are normally streamed to the database as they are
+            # extracted; only write jobs that haven't been stored yet
+            pending = [job for job in self.jobs_data if job['id'] not in self._stored_ids]
+            self.store_jobs(pending)
             
-            print(f"Saved {db_saved_count} jobs to database")
+            # store_jobs only records ids once they are actually written
+            print(f"Saved {len(self._stored_ids)} jobs to database")
             
         except Exception as e:
             print(f"Error saving jobs: {str(e)}")
+    
+    def store_jobs(self, jobs):
+        """
+        Write a batch of jobs (e.g. one page) to the database right away.
+        
+        Storing each page as it is extracted means a failure on a later page
+        doesn't lose the jobs found so far.
+        
+        Args:
+            jobs (list): Job dictionaries to store
+            
+        Returns:
+            int: Number of jobs written
+        """
+        if not jobs:
+            return 0
+        
+        try:
+            saved_count = self.db.add_jobs_bulk(jobs, self.source_name.lower())
+            self._stored_ids.update(job['id'] for job in jobs)
+            return saved_count
+            
+        except Exception as e:
+            print(f"Error storing jobs: {str(e)}")
+            return 0
             
     def cleanup(self):
         """Clean up resources."""
         # Only cleanup driver if it's a web scraper
         if self.scraper_type == "web" and self.driver:
             try:
-                self.driver.quit()
-                print(f"Browser closed successfully for {self.source_name}")
+                if self.attached_to_browser:
+                    # Close our tab, then end the WebDriver session and its
+                    # chromedriver process; ChromeDriver leaves a browser it
+                    # attached to via debuggerAddress running
+                    self.driver.close()
+                    self.driver.quit()
+                    print(f"Closed scraper tab for {self.source_name}")
+                else:
+                    self.driver.quit()
+                    print(f"Browser closed successfully for {self.source_name}")
             except Exception as e:
                 print(f"Error closing browser: {str(e)}")
         
@@ -279,7 +417,7 @@ class BaseJobScraper(ABC):
             print(f"Navigating to: {url}")
             self.driver.get(url)
             
-            self.human_like_delay(4, 6)
+            self.wait_for_page_load()
             
             # Handle login if required
             if self.requires_login:
@@ -311,6 +449,8 @@ class BaseJobScraper(ABC):
                     print(f"Error extracting jobs from {self.source_name} page: {str(extract_error)}")
                     new_jobs = []
                 
+                self.store_jobs(new_jobs)
+                
                 if not new_jobs:
                     print("No jobs found on this page")
                     break
@@ -2,12 +2,30 @@ import re
 from datetime import datetime
 from urllib.parse import urlencode
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
 
 from job_scrapers.base_scraper import BaseJobScraper
 
+# Collects the fields of every job card on the page in a single script call
+_ROWS_JS = """
+const text = (el, sel) => { const found = el.querySelector(sel); return found ? found.innerText : null; };
+return Array.from(document.querySelectorAll('.job-listing, .results-item')).map(card => {
+    const link = card.querySelector('a.job-title-link') || card.querySelector('a.jobtitle');
+    const heading = card.querySelector('h2.job-title');
+    return {
+        id: card.getAttribute('id') || card.getAttribute('data-job-id'),
+        title: heading && link ? heading.innerText : (link ? link.innerText : null),
+        url: link ? link.href : null,
+        company: text(card, 'div.company') || text(card, 'li.company'),
+        location: text(card, 'div.location') || text(card, 'li.location'),
+        remote_tag: card.querySelector('.remote-tag, .home-working') !== null,
+        posted: text(card, 'div.date-posted, li.date-posted'),
+        salary: text(card, 'div.salary, li.salary')
+    };
+});
+"""
+
 class CVLibraryScraper(BaseJobScraper):
     """Scraper for CV-Library.co.uk"""
     
@@ -62,71 +80,32 @@ class CVLibraryScraper(BaseJobScraper):
             
         return '30d'  # Default
     
-    def extract_job_details(self, job_element):
-        """Extract job details from a single listing"""
-        try:
-            # Get job ID
-            job_id = job_element.get_attribute('id') or job_element.get_attribute('data-job-id')
-            if not job_id:
-                job_id = f"cvlibrary_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    def extract_job_details(self, row):
+        """
+        Build a job record from one listing row returned by _ROWS_JS.
+        
+        Args:
+            row (dict): Raw text and attribute values for a single listing
             
-            # Get title and URL
-            try:
-                title_element = job_element.find_element(By.CSS_SELECTOR, "h2.job-title")
-                title = title_element.text.strip()
-                
-                link_element = job_element.find_element(By.CSS_SELECTOR, "a.job-title-link")
-                job_url = link_element.get_attribute('href')
-            except:
-                try:
-                    # Alternative structure
-                    title_element = job_element.find_element(By.CSS_SELECTOR, "a.jobtitle")
-                    title = title_element.text.strip()
-                    job_url = title_element.get_attribute('href')
-                except:
-                    title = "Not specified"
-                    job_url = f"https://www.cv-library.co.uk/job/{job_id}"
-            
-            # Get company
-            try:
-                company_element = job_element.find_element(By.CSS_SELECTOR, "div.company")
-                company = company_element.text.strip()
-            except:
-                try:
-                    company_element = job_element.find_element(By.CSS_SELECTOR, "li.company")
-                    company = company_element.text.strip()
-                except:
-                    company = "Not specified"
+        Returns:
+            dict: Job details, or None if the row couldn't be processed
+        """
+        try:
+            job_id = row.get('id') or f"cvlibrary_{datetime.now().strftime('%Y%m%d%H%M%S')}"
             
-            # Get location
-            try:
-                location_element = job_element.find_element(By.CSS_SELECTOR, "div.location")
-                location = location_element.text.strip()
-            except:
-                try:
-                    location_element = job_element.find_element(By.CSS_SELECTOR, "li.location")
-                    location = location_element.text.strip()
-                except:
-                    location = "Not specified"
+            title = (row.get('title') or '').strip() or "Not specified"
+            job_url = row.get('url') or f"https://www.cv-library.co.uk/job/{job_id}"
+            company = (row.get('company') or '').strip() or "Not specified"
+            location = (row.get('location') or '').strip() or "Not specified"
             
             # Check for remote indicator
-            if "remote" in location.lower() or job_element.find_elements(By.CSS_SELECTOR, ".remote-tag, .home-working"):
+            if "remote" in location.lower() or row.get('remote_tag'):
                 location = f"{location} (Remote)"
             
-            # Get posted date
-            try:
-                date_element = job_element.find_element(By.CSS_SELECTOR, "div.date-posted, li.date-posted")
-                posted_text = date_element.text.strip()
-                posted = self.parse_date_posted(posted_text)
-            except:
-                posted = "30d"  # Default
+            posted_text = row.get('posted')
+            posted = self.parse_date_posted(posted_text.strip()) if posted_text is not None else "30d"
             
-            # Get salary if available
-            try:
-                salary_element = job_element.find_element(By.CSS_SELECTOR, "div.salary, li.salary")
-                salary = salary_element.text.strip()
-            except:
-                salary = "Not specified"
+            salary = (row.get('salary') or '').strip() or "Not specified"
             
             return {
                 'id': job_id,
@@ -148,7 +127,7 @@ class CVLibraryScraper(BaseJobScraper):
         """Extract all jobs from current page"""
         try:
             print("Waiting for CV-Library job listings to load...")
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".job-listing, .results-item"))
             )
             
@@ -164,13 +143,14 @@ class CVLibraryScraper(BaseJobScraper):
             except:
                 pass  # No cookie popup or already handled
             
-            # Get all job cards
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, ".job-listing, .results-item")
-            print(f"Found {len(job_elements)} potential job listings on CV-Library page")
+            # Read every job card in one round-trip instead of several
+            # find_element calls per card
+            rows = self.driver.execute_script(_ROWS_JS)
+            print(f"Found {len(rows)} potential job listings on CV-Library page")
             
             new_jobs = []
-            for job_element in job_elements:
-                job_details = self.extract_job_details(job_element)
+            for row in rows:
+                job_details = self.extract_job_details(row)
                 if job_details:
                     new_jobs.append(job_details)
             
@@ -202,10 +182,10 @@ class CVLibraryScraper(BaseJobScraper):
         try:
             print(f"Navigating to next CV-Library page: {next_url}")
             self.driver.get(next_url)
-            self.human_like_delay(3, 5)
+            self.wait_for_page_load()
             
             # Wait for new results to load
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".job-listing, .results-item"))
             )
             
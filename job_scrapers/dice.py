@@ -2,7 +2,6 @@ import re
 from datetime import datetime
 from urllib.parse import urlencode
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
@@ -43,7 +42,7 @@ class DiceScraper(BaseJobScraper):
             self.human_like_delay(2, 3)
             
             # Enter email
-            email_field = WebDriverWait(self.driver, 10).until(
+            email_field = self.wait(10).until(
                 EC.element_to_be_clickable((By.ID, "email"))
             )
             email_field.clear()
@@ -63,7 +62,7 @@ class DiceScraper(BaseJobScraper):
             
             # Verify login success
             try:
-                WebDriverWait(self.driver, 10).until(
+                self.wait(10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".logged-in-container"))
                 )
                 print("Successfully logged in to Dice")
@@ -194,7 +193,7 @@ class DiceScraper(BaseJobScraper):
         """Extract all jobs from current page"""
         try:
             print("Waiting for Dice job listings to load...")
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "dhi-search-card"))
             )
             
@@ -237,7 +236,7 @@ class DiceScraper(BaseJobScraper):
             
             # Wait for new results to load
             self.human_like_delay(3, 5)
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "dhi-search-card"))
             )
             
@@ -2,7 +2,6 @@ import re
 from datetime import datetime
 from urllib.parse import urlencode
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, ElementClickInterceptedException
 
@@ -55,7 +54,7 @@ class GlassdoorScraper(BaseJobScraper):
             # Enter email - Glassdoor has multiple possible login form structures
             try:
                 # Try to find the email field
-                email_field = WebDriverWait(self.driver, 10).until(
+                email_field = self.wait(10).until(
                     EC.element_to_be_clickable((By.ID, "modalUserEmail")) or
                     EC.element_to_be_clickable((By.ID, "userEmail")) or
                     EC.element_to_be_clickable((By.NAME, "username"))
@@ -72,7 +71,7 @@ class GlassdoorScraper(BaseJobScraper):
                     pass  # No continue button
                 
                 # Now try to find the password field
-                password_field = WebDriverWait(self.driver, 10).until(
+                password_field = self.wait(10).until(
                     EC.element_to_be_clickable((By.ID, "modalUserPassword")) or
                     EC.element_to_be_clickable((By.ID, "userPassword")) or
                     EC.element_to_be_clickable((By.NAME, "password"))
@@ -89,7 +88,7 @@ class GlassdoorScraper(BaseJobScraper):
                 
                 # Verify login success
                 try:
-                    WebDriverWait(self.driver, 10).until(
+                    self.wait(10).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, ".member-home-content, .user-menu"))
                     )
                     print("Successfully logged in to Glassdoor")
@@ -255,7 +254,7 @@ class GlassdoorScraper(BaseJobScraper):
         """Extract all jobs from current page"""
         try:
             print("Waiting for Glassdoor job listings to load...")
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "li.react-job-listing"))
             )
             
@@ -313,7 +312,7 @@ class GlassdoorScraper(BaseJobScraper):
             
             # Wait for new results to load
             self.human_like_delay(3, 5)
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "li.react-job-listing"))
             )
             
@@ -1,8 +1,8 @@
 import re
 from datetime import datetime, timedelta
 from urllib.parse import quote, urlencode
+from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
 
@@ -64,55 +64,56 @@ class IndeedScraper(BaseJobScraper):
             
         return '30d'  # Default to 30 days if can't parse
     
+    @staticmethod
+    def _text(job_element, *selectors):
+        """Stripped text of the first selector that matches, or None"""
+        for selector in selectors:
+            element = job_element.select_one(selector)
+            if element is not None:
+                return element.get_text(' ', strip=True)
+        return None
+    
     def extract_job_details(self, job_element):
-        """Extract all details from a single job listing"""
+        """
+        Extract all details from a single job listing.
+        
+        Args:
+            job_element (bs4.element.Tag): A job card from the parsed page source
+            
+        Returns:
+            dict: Job details or None if extraction failed
+        """
         try:
             # Get job ID from data attribute
-            job_id = job_element.get_attribute('data-jk') or job_element.get_attribute('id').replace('job_', '')
+            job_id = job_element.get('data-jk') or (job_element.get('id') or '').replace('job_', '')
+            if not job_id:
+                return None
             
             # Get title
-            try:
-                title_element = job_element.find_element(By.CSS_SELECTOR, "h2.jobTitle span")
-                title = title_element.text.strip()
-            except NoSuchElementException:
-                title_element = job_element.find_element(By.CSS_SELECTOR, "h2.jobTitle")
-                title = title_element.text.strip()
+            title = self._text(job_element, "h2.jobTitle span", "h2.jobTitle")
+            if title is None:
+                return None
                 
             # Get company
-            try:
-                company_element = job_element.find_element(By.CSS_SELECTOR, "span.companyName")
-                company = company_element.text.strip()
-            except NoSuchElementException:
-                company = "Not specified"
+            company = self._text(job_element, "span.companyName") or "Not specified"
                 
             # Get location
-            try:
-                location_element = job_element.find_element(By.CSS_SELECTOR, "div.companyLocation")
-                location = location_element.text.strip()
-                
-                if 'remote' in location.lower():
-                    location = f"{location} (Remote)"
-            except NoSuchElementException:
+            location = self._text(job_element, "div.companyLocation")
+            if location is None:
                 location = "Not specified"
+            elif 'remote' in location.lower():
+                location = f"{location} (Remote)"
                 
             # Get salary if available
-            try:
-                salary_element = job_element.find_element(By.CSS_SELECTOR, "div.salary-snippet-container")
-                salary = salary_element.text.strip()
-            except NoSuchElementException:
-                try:
-                    salary_element = job_element.find_element(By.CSS_SELECTOR, "div.metadata.salary-snippet-container")
-                    salary = salary_element.text.strip()
-                except NoSuchElementException:
-                    salary = "Not specified"
+            salary = self._text(job_element, "div.salary-snippet-container",
+                                "div.metadata.salary-snippet-container") or "Not specified"
                     
             # Get posted date
-            try:
-                date_element = job_element.find_element(By.CSS_SELECTOR, "span.date")
-                posted_text = date_element.text.replace('Posted', '').strip()
-                posted = self.parse_date_posted(posted_text)
-            except NoSuchElementException:
+            posted_text = self._text(job_element, "span.date")
+            if posted_text is None:
                 posted = "Not specified"
+            else:
+                posted = self.parse_date_posted(posted_text.replace('Posted', '').strip())
                 
             # Get job URL
             job_url = f"https://www.indeed.com/viewjob?jk={job_id}"
@@ -138,14 +139,18 @@ class IndeedScraper(BaseJobScraper):
         """Extract all jobs from current page"""
         try:
             print("Waiting for Indeed job listings to load...")
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "div.job_seen_beacon"))
             )
             
             self.human_like_delay(2, 4)
             
+            # Parse the rendered page once instead of querying the browser
+            # for every field of every job card
+            soup = BeautifulSoup(self.driver.page_source, 'lxml')
+            
             # Indeed uses different job card classes
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon, div.tapItem")
+            job_elements = soup.select("div.job_seen_beacon, div.tapItem")
             print(f"Found {len(job_elements)} potential job listings on current Indeed page")
             
             new_jobs = []
@@ -185,11 +190,11 @@ class IndeedScraper(BaseJobScraper):
         try:
             print(f"Navigating to next Indeed page: {next_url}")
             self.driver.get(next_url)
-            self.human_like_delay(3, 5)
+            self.wait_for_page_load()
             
             # Handle potential popup
             try:
-                popup_close = WebDriverWait(self.driver, 3).until(
+                popup_close = self.wait(3).until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "button.icl-CloseButton"))
                 )
                 popup_close.click()
@@ -2,7 +2,6 @@ import re
 from datetime import datetime
 from urllib.parse import urlencode
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
 
@@ -157,7 +156,7 @@ class JobsiteScraper(BaseJobScraper):
         """Extract all jobs from current page"""
         try:
             print("Waiting for Jobsite job listings to load...")
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".job-card, .results-item"))
             )
             
@@ -165,7 +164,7 @@ class JobsiteScraper(BaseJobScraper):
             
             # Handle cookie consent if it appears
             try:
-                cookie_button = WebDriverWait(self.driver, 3).until(
+                cookie_button = self.wait(3).until(
                     EC.element_to_be_clickable((By.ID, "ccmgt_explicit_accept"))
                 )
                 cookie_button.click()
@@ -212,10 +211,10 @@ class JobsiteScraper(BaseJobScraper):
         try:
             print(f"Navigating to next Jobsite page: {next_url}")
             self.driver.get(next_url)
-            self.human_like_delay(3, 5)
+            self.wait_for_page_load()
             
             # Wait for new results to load
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".job-card, .results-item"))
             )
             
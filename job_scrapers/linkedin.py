@@ -3,7 +3,6 @@ import time
 from datetime import datetime
 from urllib.parse import quote
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, ElementClickInterceptedException
 
@@ -47,7 +46,7 @@ class LinkedInScraper(BaseJobScraper):
             self.human_like_delay(2, 3)
             
             # Enter username
-            username_field = WebDriverWait(self.driver, 10).until(
+            username_field = self.wait(10).until(
                 EC.element_to_be_clickable((By.ID, "username"))
             )
             username_field.clear()
@@ -67,7 +66,7 @@ class LinkedInScraper(BaseJobScraper):
             
             # Check if login was successful by looking for the LinkedIn logo
             try:
-                WebDriverWait(self.driver, 10).until(
+                self.wait(10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".global-nav__logo"))
                 )
                 print("Successfully logged in to LinkedIn")
@@ -140,7 +139,7 @@ class LinkedInScraper(BaseJobScraper):
                 job_id = f"linkedin_{datetime.now().strftime('%Y%m%d%H%M%S')}"
             
             # Wait for job details to load
-            WebDriverWait(self.driver, 10).until(
+            self.wait(10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-title"))
             )
             
@@ -238,7 +237,7 @@ class LinkedInScraper(BaseJobScraper):
         """Extract all jobs from current page"""
         try:
             print("Waiting for LinkedIn job listings to load...")
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "li.jobs-search-results__list-item"))
             )
             
@@ -282,7 +281,7 @@ class LinkedInScraper(BaseJobScraper):
             self.human_like_delay(3, 5)
             
             # Wait for job listings to reload
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "li.jobs-search-results__list-item"))
             )
             
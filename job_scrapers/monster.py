@@ -2,7 +2,6 @@ import re
 from datetime import datetime
 from urllib.parse import urlencode
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
@@ -42,7 +41,7 @@ class MonsterScraper(BaseJobScraper):
             
             # Accept cookies if popup appears
             try:
-                cookie_button = WebDriverWait(self.driver, 5).until(
+                cookie_button = self.wait(5).until(
                     EC.element_to_be_clickable((By.ID, "onetrust-accept-btn-handler"))
                 )
                 cookie_button.click()
@@ -51,7 +50,7 @@ class MonsterScraper(BaseJobScraper):
                 pass  # No cookie popup
             
             # Enter email
-            email_field = WebDriverWait(self.driver, 10).until(
+            email_field = self.wait(10).until(
                 EC.element_to_be_clickable((By.ID, "email"))
             )
             email_field.clear()
@@ -71,7 +70,7 @@ class MonsterScraper(BaseJobScraper):
             
             # Verify login success by checking for profile elements
             try:
-                WebDriverWait(self.driver, 10).until(
+                self.wait(10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".user-menu-toggle"))
                 )
                 print("Successfully logged in to Monster")
@@ -192,7 +191,7 @@ class MonsterScraper(BaseJobScraper):
         """Extract all jobs from current page"""
         try:
             print("Waiting for Monster job listings to load...")
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".job-card"))
             )
             
@@ -246,7 +245,7 @@ class MonsterScraper(BaseJobScraper):
                 
             # Wait for new results to load
             self.human_like_delay(3, 5)
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".job-card"))
             )
             
@@ -111,7 +111,8 @@ class JobScraperCoordinator:
         """
         return self.platform_configs.get(platform_name, {})
     
-    def run_scraper(self, scraper_name, max_pages=5, remote_only=True, query="frontend developer", **kwargs):
+    def run_scraper(self, scraper_name, max_pages=5, remote_only=True, query="frontend developer",
+                    api_strategy=None, **kwargs):
         """
         Run a specific job scraper with smart API selection.
         
@@ -120,13 +121,15 @@ class JobScraperCoordinator:
             max_pages (int, optional): Maximum number of pages to scrape
             remote_only (bool, optional): Whether to filter for remote jobs
             query (str): Search query for job matching
+            api_strategy (dict, optional): Precomputed strategy from _get_api_strategy
             
         Returns:
             list: The extracted job data
         """
         try:
             # First, try API scrapers if applicable
-            api_jobs = self._try_api_scrapers(scraper_name, query, remote_only, **kwargs)
+            api_jobs = self._try_api_scrapers(scraper_name, query, remote_only,
+                                              api_strategy=api_strategy, **kwargs)
             if api_jobs:
                 return api_jobs
             
@@ -137,17 +140,29 @@ class JobScraperCoordinator:
             print(f"Error running {scraper_name} scraper: {str(e)}")
             return []
     
-    def _try_api_scrapers(self, platform_name: str, query: str, remote_only: bool, **kwargs) -> List[Dict]:
-        """Try to get jobs using API scrapers first"""
-        platform_lower = platform_name.lower()
+    def _get_api_strategy(self, query: str, platforms: List[str]) -> Dict[str, List[tuple]]:
+        """
+        Get the optimal API strategy grouped by lowercased platform name.
         
-        # Get optimal API strategy
-        strategy = self.usage_manager.get_optimal_api_strategy(query, [platform_name])
+        Args:
+            query (str): Search query for job matching
+            platforms (List[str]): Platforms to plan API calls for
+            
+        Returns:
+            Dict[str, List[tuple]]: Strategy entries keyed by platform
+        """
+        by_platform = {}
+        for entry in self.usage_manager.get_optimal_api_strategy(query, platforms):
+            by_platform.setdefault(entry[1].lower(), []).append(entry)
+        return by_platform
+    
+    def _try_api_scrapers(self, platform_name: str, query: str, remote_only: bool,
+                          api_strategy: Optional[Dict[str, List[tuple]]] = None, **kwargs) -> List[Dict]:
+        """Try to get jobs using API scrapers first"""
+        if api_strategy is None:
+            api_strategy = self._get_api_strategy(query, [platform_name])
         
-        for api_name, target_platform, estimated_calls in strategy:
-            if target_platform.lower() != platform_lower:
-                continue
-                
+        for api_name, target_platform, estimated_calls in api_strategy.get(platform_name.lower(), []):
             try:
                 if api_name == 'adzuna' and 'adzuna' in self.api_credentials:
                     print(f"Using Adzuna API for {platform_name}")
@@ -225,7 +240,8 @@ class JobScraperCoordinator:
             print(f"Error running {scraper_name} web scraper: {str(e)}")
             return []
     
-    def run_available_scrapers(self, max_pages=5, remote_only=True, skip_login_required=False):
+    def run_available_scrapers(self, max_pages=5, remote_only=True, skip_login_required=False,
+                               query="frontend developer"):
         """
         Run all available scrapers.
         
@@ -233,6 +249,7 @@ class JobScraperCoordinator:
             max_pages (int, optional): Maximum number of pages to scrape per platform
             remote_only (bool, optional): Whether to filter for remote jobs
             skip_login_required (bool, optional): Whether to skip platforms requiring login
+            query (str, optional): Search query for job matching
             
         Returns:
             dict: Dictionary with platform names as keys and their job data as values
@@ -241,6 +258,7 @@ class JobScraperCoordinator:
         results = {}
         
         print(f"\nRunning job search across {len(available_scrapers)} platforms:")
+        scrapers_to_run = []
         for name, info in available_scrapers.items():
             # Skip if requires login and we're set to skip those
             if skip_login_required and info['requires_login']:
@@ -252,8 +270,15 @@ class JobScraperCoordinator:
                 print(f"Skipping {name} (no login credentials provided)")
                 continue
             
+            scrapers_to_run.append(name)
+        
+        # Compute the API strategy once for every platform instead of per platform
+        api_strategy = self._get_api_strategy(query, scrapers_to_run)
+        
+        for name in scrapers_to_run:
             print(f"\n--- Starting {name} scraper ---")
-            results[name] = self.run_scraper(name, max_pages, remote_only)
+            results[name] = self.run_scraper(name, max_pages, remote_only, query=query,
+                                             api_strategy=api_strategy)
             print(f"--- Completed {name} scraper ({len(results[name])} jobs found) ---")
         
         # Print summary
@@ -1,97 +1,180 @@
+import functools
 import importlib
+import logging
 import os
-import inspect
-from typing import Dict, Any, List
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Any, FrozenSet, List, Optional
 from job_scrapers.base_scraper import BaseJobScraper
 from job_scrapers.api_scrapers import create_api_scraper
 
+logger = logging.getLogger(__name__)
+
+# Modules in the scrapers package that do not define web scrapers
+_EXCLUDED_FILES = frozenset({
+    '__init__.py', 'base_scraper.py', 'scraper_factory.py',
+    'scraper_coordinator.py', 'api_scrapers.py', 'api_usage_manager.py'
+})
+
+# Sites whose web scrapers need a logged-in session
+_LOGIN_SITES = frozenset({'linkedin', 'glassdoor', 'dice', 'monster'})
+
+# API scrapers are fixed, so their metadata is built once at import time
+_API_SCRAPERS = {
+    'adzuna': {
+        'type': 'api',
+        'requires_login': False,
+        'requires_credentials': True,
+        'platforms_covered': ['indeed', 'monster', 'dice', 'jobsite', 'cvlibrary'],
+        'quota_limit': 1000,
+        'description': 'Adzuna API - covers multiple job boards'
+    },
+    'jsearch': {
+        'type': 'api',
+        'requires_login': False,
+        'requires_credentials': True,
+        'platforms_covered': ['linkedin', 'glassdoor', 'indeed'],
+        'quota_limit': 200,
+        'description': 'JSearch API - Google for Jobs aggregator (LIMITED QUOTA)'
+    },
+    'arbeitsnow': {
+        'type': 'api',
+        'requires_login': False,
+        'requires_credentials': False,
+        'platforms_covered': ['arbeitsnow'],
+        'quota_limit': None,
+        'description': 'ArbeitsNow API - free international jobs'
+    }
+}
+
+def _build_api_index(api_scrapers):
+    """Map each platform to the first API scraper that covers it"""
+    api_by_platform = {}
+    for api_name, info in api_scrapers.items():
+        for platform in info['platforms_covered']:
+            api_by_platform.setdefault(platform, api_name)
+    return api_by_platform
+
+_API_BY_PLATFORM = _build_api_index(_API_SCRAPERS)
+
+# scrapers_dir -> (mtime, module entries), reused while the directory is unchanged
+_DIR_CACHE = {}
+
+def _cached_listdir(scrapers_dir):
+    """
+    List candidate scraper modules in a directory.
+    
+    The filtered listing is cached against the directory's mtime, so repeated
+    scans only hit the filesystem again after a file is added or removed.
+    Name normalization and the login check are done here once per module
+    rather than on every registry rebuild.
+    
+    Returns:
+        list: (module_name, scraper_name, requires_login) tuples
+    """
+    mtime = os.stat(scrapers_dir).st_mtime
+    cached = _DIR_CACHE.get(scrapers_dir)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    entries = []
+    for path in sorted(Path(scrapers_dir).glob('*.py')):
+        if path.name in _EXCLUDED_FILES:
+            continue
+        scraper_name = path.stem.replace('_', '').lower()
+        requires_login = any(login_site in scraper_name for login_site in _LOGIN_SITES)
+        entries.append((path.stem, scraper_name, requires_login))
+    
+    _DIR_CACHE[scrapers_dir] = (mtime, entries)
+    return entries
+
 class JobScraperFactory:
     """Factory class for creating job scrapers"""
     
-    @staticmethod
-    def get_available_scrapers():
+    # Discovered scrapers, populated on the first get_available_scrapers() call
+    _SCRAPERS_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    @classmethod
+    def invalidate(cls):
+        """Clear the cached scraper registry so the next lookup rediscovers scrapers"""
+        cls._SCRAPERS_CACHE = None
+        _scrapers_by_type.cache_clear()
+        _scraper_names.cache_clear()
+        _platforms_covered.cache_clear()
+    
+    @classmethod
+    def get_available_scrapers(cls):
         """
         Get a list of available job scraper classes including both web and API scrapers.
         
+        The registry is cached after the first call; use invalidate() to force
+        a rescan of the scrapers directory. A shallow copy is returned, so
+        adding or removing entries doesn't affect the cache, but the metadata
+        dicts themselves are shared and should be treated as read-only.
+        
         Returns:
             dict: Dictionary mapping scraper names to their metadata
         """
-        available_scrapers = {}
-        
-        # Add API scrapers first
-        api_scrapers = {
-            'adzuna': {
-                'type': 'api',
-                'requires_login': False,
-                'requires_credentials': True,
-                'platforms_covered': ['indeed', 'monster', 'dice', 'jobsite', 'cvlibrary'],
-                'quota_limit': 1000,
-                'description': 'Adzuna API - covers multiple job boards'
-            },
-            'jsearch': {
-                'type': 'api',
-                'requires_login': False,
-                'requires_credentials': True,
-                'platforms_covered': ['linkedin', 'glassdoor', 'indeed'],
-                'quota_limit': 200,
-                'description': 'JSearch API - Google for Jobs aggregator (LIMITED QUOTA)'
-            },
-            'arbeitsnow': {
-                'type': 'api',
-                'requires_login': False,
-                'requires_credentials': False,
-                'platforms_covered': ['arbeitsnow'],
-                'quota_limit': None,
-                'description': 'ArbeitsNow API - free international jobs'
-            }
-        }
+        return dict(cls._cached_scrapers())
+    
+    @classmethod
+    def _cached_scrapers(cls):
+        """Return the memoized scraper registry, discovering scrapers on first use"""
+        if cls._SCRAPERS_CACHE is not None:
+            return cls._SCRAPERS_CACHE
         
-        available_scrapers.update(api_scrapers)
+        # Add API scrapers first (copied so callers can't mutate the shared metadata)
+        available_scrapers = {name: info.copy() for name, info in _API_SCRAPERS.items()}
         
         # Get web scrapers from files
         scrapers_dir = os.path.dirname(os.path.abspath(__file__))
         
-        # Iterate through Python files in the scrapers directory
-        excluded_files = ['__init__.py', 'base_scraper.py', 'scraper_factory.py', 
-                         'scraper_coordinator.py', 'api_scrapers.py', 'api_usage_manager.py']
-        
-        for filename in os.listdir(scrapers_dir):
-            if filename.endswith('.py') and filename not in excluded_files:
-                module_name = filename[:-3]  # Remove .py extension
-                
-                try:
-                    # Import the module
-                    module = importlib.import_module(f'job_scrapers.{module_name}')
-                    
-                    # Find scraper classes that inherit from BaseJobScraper
-                    for name, obj in inspect.getmembers(module):
-                        if (inspect.isclass(obj) and 
-                            issubclass(obj, BaseJobScraper) and 
-                            obj != BaseJobScraper):
-                            
-                            # Get class name and determine if requires login
-                            scraper_name = name.replace('Scraper', '').replace('JobScraper', '').lower()
-                            requires_login = any(login_site in name.lower() 
-                                               for login_site in ['linkedin', 'glassdoor', 'dice', 'monster'])
-                            
-                            # Add to available scrapers
-                            available_scrapers[scraper_name] = {
-                                'class': obj,
-                                'type': 'web',
-                                'requires_login': requires_login,
-                                'requires_credentials': requires_login,
-                                'platforms_covered': [scraper_name],
-                                'quota_limit': None,
-                                'description': f'{scraper_name.title()} web scraper'
-                            }
-                            
-                except Exception as e:
-                    print(f"Error loading module {module_name}: {str(e)}")
+        # Record web scrapers by module name only; the module (and Selenium
+        # with it) is imported when the scraper is actually created
+        for module_name, scraper_name, requires_login in _cached_listdir(scrapers_dir):
+            available_scrapers[scraper_name] = {
+                'class': None,
+                'module': module_name,
+                'type': 'web',
+                'requires_login': requires_login,
+                'requires_credentials': requires_login,
+                'platforms_covered': [scraper_name],
+                'quota_limit': None,
+                'description': f'{scraper_name.title()} web scraper'
+            }
         
+        cls._SCRAPERS_CACHE = available_scrapers
         return available_scrapers
     
     @staticmethod
-    def create_scraper(scraper_name, db_instance=None, prefer_api=True):
+    def _load_scraper_class(scraper_info):
+        """
+        Import a web scraper's module on first use and return its scraper class.
+        
+        Args:
+            scraper_info (dict): Registry entry for a web scraper
+            
+        Returns:
+            type: The BaseJobScraper subclass defined in the module
+        """
+        if scraper_info['class'] is None:
+            # Import the module, reusing it if it has already been loaded
+            fullname = f"job_scrapers.{scraper_info['module']}"
+            module = sys.modules.get(fullname) or importlib.import_module(fullname)
+            
+            # Find the scraper class defined in that module
+            for obj in BaseJobScraper.__subclasses__():
+                if obj.__module__ == module.__name__:
+                    scraper_info['class'] = obj
+                    break
+            else:
+                raise ImportError(f"No scraper class found in module {fullname}")
+        
+        return scraper_info['class']
+    
+    @classmethod
+    def create_scraper(cls, scraper_name, db_instance=None, prefer_api=True):
         """
         Create an instance of the specified job scraper.
         
@@ -103,37 +186,36 @@ class JobScraperFactory:
         Returns:
             BaseJobScraper or BaseAPIScraper: An instance of the requested scraper
         """
-        available_scrapers = JobScraperFactory.get_available_scrapers()
+        available_scrapers = cls._cached_scrapers()
         scraper_name_lower = scraper_name.lower()
         
-        # First, try to find an exact match
-        if scraper_name_lower in available_scrapers:
-            scraper_info = available_scrapers[scraper_name_lower]
-            
+        # First, try to find an exact match. Scraper names are stored
+        # lowercased, so this is a single dict lookup.
+        scraper_info = available_scrapers.get(scraper_name_lower)
+        if scraper_info is not None:
             if scraper_info['type'] == 'api':
                 return create_api_scraper(scraper_name_lower, db_instance) 
             else:
-                return scraper_info['class'](db_instance=db_instance)
+                return cls._load_scraper_class(scraper_info)(db_instance=db_instance)
         
         # If prefer_api is True, look for API scrapers that cover the requested platform
         if prefer_api:
-            for api_name, info in available_scrapers.items():
-                if (info['type'] == 'api' and 
-                    scraper_name_lower in info.get('platforms_covered', [])):
-                    print(f"Using {api_name} API for {scraper_name}")
-                    return create_api_scraper(api_name, db_instance)
+            api_name = _API_BY_PLATFORM.get(scraper_name_lower)
+            if api_name:
+                logger.info("Using %s API for %s", api_name, scraper_name)
+                return create_api_scraper(api_name, db_instance)
         
-        # Fallback: look for web scraper by partial match
+        # Fallback: look for web scraper by partial match (registry keys are
+        # always lowercase, so they can be compared directly)
         for name, info in available_scrapers.items():
-            if (info['type'] == 'web' and 
-                (name.lower() == scraper_name_lower or scraper_name_lower in name.lower())):
-                return info['class'](db_instance=db_instance)
+            if info['type'] == 'web' and scraper_name_lower in name:
+                return cls._load_scraper_class(info)(db_instance=db_instance)
         
         available_names = list(available_scrapers.keys())
         raise ValueError(f"Scraper '{scraper_name}' not found. Available scrapers: {', '.join(available_names)}")
     
-    @staticmethod
-    def get_scrapers_by_type(scraper_type: str = None) -> Dict[str, Dict[str, Any]]:
+    @classmethod
+    def get_scrapers_by_type(cls, scraper_type: str = None) -> Dict[str, Dict[str, Any]]:
         """
         Get scrapers filtered by type.
         
@@ -141,37 +223,74 @@ class JobScraperFactory:
             scraper_type (str): Filter by type ('api', 'web', or None for all)
             
         Returns:
-            Dict: Filtered scrapers
+            Dict: Filtered scrapers (a shallow copy of the cached view; the
+            metadata dicts are shared and should be treated as read-only)
+        """
+        return dict(_scrapers_by_type(scraper_type))
+    
+    @classmethod
+    def get_api_scrapers(cls) -> FrozenSet[str]:
         """
-        all_scrapers = JobScraperFactory.get_available_scrapers()
+        Get the names of all API scrapers.
         
-        if scraper_type is None:
-            return all_scrapers
+        Returns:
+            FrozenSet[str]: API scraper names
+        """
+        return _scraper_names('api')
+    
+    @classmethod
+    def get_web_scrapers(cls) -> FrozenSet[str]:
+        """
+        Get the names of all web scrapers.
         
-        return {name: info for name, info in all_scrapers.items() 
-                if info.get('type') == scraper_type}
+        Returns:
+            FrozenSet[str]: Web scraper names
+        """
+        return _scraper_names('web')
     
-    @staticmethod
-    def get_platforms_covered() -> Dict[str, List[str]]:
+    @classmethod
+    def get_platforms_covered(cls) -> Dict[str, List[str]]:
         """
         Get all platforms and which scrapers can handle them.
         
         Returns:
-            Dict: Platform -> list of scrapers that can handle it
+            Dict: Platform -> list of scrapers that can handle it (copied from
+            the cached mapping, so callers can modify the result)
         """
-        all_scrapers = JobScraperFactory.get_available_scrapers()
-        platform_coverage = {}
-        
-        for scraper_name, info in all_scrapers.items():
-            platforms = info.get('platforms_covered', [scraper_name])
-            for platform in platforms:
-                if platform not in platform_coverage:
-                    platform_coverage[platform] = []
-                platform_coverage[platform].append({
-                    'scraper': scraper_name,
-                    'type': info.get('type', 'web'),
-                    'quota_limit': info.get('quota_limit'),
-                    'requires_credentials': info.get('requires_credentials', False)
-                })
-        
-        return platform_coverage
\ No newline at end of file
+        return {platform: list(scrapers) for platform, scrapers in _platforms_covered().items()}
+
+# These views are derived purely from the registry, so they are cached until
+# JobScraperFactory.invalidate() clears it
+
+@functools.lru_cache(maxsize=8)
+def _scrapers_by_type(scraper_type: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Registry entries of the given type ('api', 'web', or None for all)"""
+    all_scrapers = JobScraperFactory._cached_scrapers()
+    
+    if scraper_type is None:
+        return all_scrapers
+    
+    return {name: info for name, info in all_scrapers.items() 
+            if info.get('type') == scraper_type}
+
+@functools.lru_cache(maxsize=2)
+def _scraper_names(scraper_type: str) -> FrozenSet[str]:
+    """Names of the registry entries of the given type"""
+    return frozenset(_scrapers_by_type(scraper_type))
+
+@functools.lru_cache(maxsize=1)
+def _platforms_covered() -> Dict[str, List[str]]:
+    """Platform -> list of scrapers that can handle it"""
+    platform_coverage = defaultdict(list)
+    
+    for scraper_name, info in JobScraperFactory._cached_scrapers().items():
+        platforms = info.get('platforms_covered', [scraper_name])
+        for platform in platforms:
+            platform_coverage[platform].append({
+                'scraper': scraper_name,
+                'type': info.get('type', 'web'),
+                'quota_limit': info.get('quota_limit'),
+                'requires_credentials': info.get('requires_credentials', False)
+            })
+    
+    return dict(platform_coverage)
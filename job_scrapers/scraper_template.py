@@ -10,7 +10,6 @@ To implement a new job platform scraper:
 
 from datetime import datetime
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
 
@@ -98,7 +97,7 @@ class TemplateJobScraper(BaseJobScraper):
         """
         try:
             # Wait for job listings to load
-            WebDriverWait(self.driver, 15).until(
+            self.wait(15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".job-listing"))
             )
             
@@ -148,7 +147,7 @@ class TemplateJobScraper(BaseJobScraper):
         try:
             # Navigate to next page
             self.driver.get(next_url)
-            self.human_like_delay(3, 5)
+            self.wait_for_page_load()
             return True
         except:
             return False
\ No newline at end of file
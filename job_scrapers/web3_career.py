@@ -1,20 +1,101 @@
 import os
-from datetime import datetime
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import re
+import gzip
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from operator import itemgetter
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from job_scrapers.base_scraper import BaseJobScraper
 
+logger = logging.getLogger(__name__)
+
+# Keywords in a title that mark a listing as a bootcamp/course ad rather than a job
+_BOOTCAMP_RE = re.compile(r'bootcamp|course|guaranteed|learn|training', re.IGNORECASE)
+
+# Posted times are shown as e.g. "3d"
+_DAYS_RE = re.compile(r'^\s*(\d+)\s*d\s*$')
+
+# Sort key for jobs whose posted time isn't in days (e.g. hours, "Not specified")
+_UNKNOWN_AGE = 9999
+
+def _days_ago(posted):
+    """Get the age in days from a posted time like "3d", or _UNKNOWN_AGE"""
+    match = _DAYS_RE.match(posted or '')
+    return int(match.group(1)) if match else _UNKNOWN_AGE
+
+_USER_AGENT = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+               '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+# Shared by every scraper instance in the process so pages and repeated runs
+# reuse pooled keep-alive connections instead of a new TLS handshake each time
+_SESSION = None
+
+def _get_session():
+    """Return the shared HTTP session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        session.headers['User-Agent'] = _USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=Web3CareerScraper._MAX_PARALLEL_PAGES,
+            max_retries=Retry(total=2, backoff_factor=0.5,
+                              status_forcelist=(429, 500, 502, 503, 504))
+        )
+        session.mount('https://', adapter)
+        _SESSION = session
+    return _SESSION
+
 class Web3CareerScraper(BaseJobScraper):
     """Scraper for web3.career"""
     
-    def __init__(self, db_instance=None):
+    _BASE_URL = "https://web3.career"
+    _FALLBACK_PREFIX = _BASE_URL + "/front-end-jobs/"
+    
+    _REQUEST_TIMEOUT = 30
+    
+    # Listing pages are numbered (?page=N), so several can be fetched at once
+    _MAX_PARALLEL_PAGES = 3
+    
+    # Internal sort key, not written to the CSV backup
+    _CSV_EXCLUDED_FIELDS = frozenset({'days_ago'})
+    
+    def __init__(self, db_instance=None, use_cache=True):
+        """
+        Initialize the web3.career scraper.
+        
+        Args:
+            db_instance (JobApplicationDB): Shared database instance
+            use_cache (bool): Reuse pages cached earlier today; when False every
+                page is downloaded again and the cached copy refreshed
+        """
         super().__init__(source_name="web3.career", requires_login=False, db_instance=db_instance)
+        
+        # web3.career serves its job table as static HTML, so plain HTTP
+        # requests replace the browser entirely
+        self.session = _get_session()
+        self.soup = None
+        
+        # Downloaded pages are cached on disk so same-day re-runs skip the network
+        self.use_cache = use_cache
+        self.cache_dir = os.path.join(".cache", "web3")
+        self.cache_duration_hours = 12
+        self.cache_max_entries = 200
+        
+        # Ids of jobs already stored (or extracted this run), which are skipped
+        self.seen_ids = set()
+        self.skipped_seen = 0
     
     def get_base_url(self, remote_only=True):
         """Get the starting URL based on remote filter"""
-        return "https://web3.career/front-end+remote-jobs" if remote_only else "https://web3.career/front-end-jobs"
+        return f"{self._BASE_URL}/front-end+remote-jobs" if remote_only else f"{self._BASE_URL}/front-end-jobs"
     
     def login(self, username, password):
         """Not required for web3.career"""
@@ -22,138 +103,308 @@ class Web3CareerScraper(BaseJobScraper):
     
     def is_bootcamp_or_ad(self, job_element):
         """Check if the job listing is actually a bootcamp ad or sponsored content"""
-        try:
-            bootcamp_indicators = ['bootcamp', 'course', 'guaranteed', 'learn', 'training']
-            job_text = job_element.text.lower()
-            
-            is_sponsored = 'sponsor' in job_element.get_attribute('id').lower() if job_element.get_attribute('id') else False
-            has_bootcamp_keywords = any(indicator in job_text for indicator in bootcamp_indicators)
-            
-            return is_sponsored or has_bootcamp_keywords
-        except Exception:
-            return False
+        if 'sponsor' in (job_element.get('element_id') or '').lower():
+            return True
+        
+        return bool(_BOOTCAMP_RE.search(job_element.get('title') or ''))
     
     def extract_job_details(self, job_element):
-        """Extract all details from a single job listing"""
+        """
+        Extract all details from a single job listing.
+        
+        Args:
+            job_element (dict): Raw row fields as returned by _parse_row
+            
+        Returns:
+            dict: Job details or None if the row is not a usable job
+        """
         try:
             if self.is_bootcamp_or_ad(job_element):
                 return None
 
-            job_id = job_element.get_attribute('data-jobid')
-            if not job_id:
+            job_id = job_element.get('id')
+            title = job_element.get('title')
+            company = job_element.get('company')
+            if not job_id or not title or not company:
                 return None
 
-            # Get title
-            title_element = job_element.find_element(By.CSS_SELECTOR, "h2.fs-6.fs-md-5.fw-bold.my-primary")
-            title = title_element.text.strip()
-
-            # Get company
-            company_element = job_element.find_element(By.CSS_SELECTOR, "h3[style*='font-size: 12px']")
-            company = company_element.text.strip()
-
-            # Get location
-            try:
-                # Find the fourth td element which contains the location
-                location_td = job_element.find_elements(By.TAG_NAME, "td")[3]
-                location_element = location_td.find_element(By.CSS_SELECTOR, "span[style*='color: #d5d3d3'], a[style*='color: #d5d3d3']")
-                location = location_element.text.strip()
-            except:
-                location = "Not specified"
-
-            # Get salary
-            try:
-                salary_element = job_element.find_element(By.CSS_SELECTOR, "p[class*='text-salary']")
-                salary = salary_element.text.split('\n')[0].strip()
-            except:
-                salary = "Not specified"
-
-            # Get posted time
-            try:
-                time_element = job_element.find_element(By.TAG_NAME, "time")
-                posted = time_element.text.strip()
-            except:
-                posted = "Not specified"
-
-            # Get tags
-            try:
-                tag_elements = job_element.find_elements(By.CSS_SELECTOR, "span.my-badge.my-badge-secondary a")
-                tags = [tag.text.strip() for tag in tag_elements if tag.text.strip()]
-            except:
-                tags = []
-
-            # Get job URL
-            try:
-                job_link = title_element.find_element(By.XPATH, "..").get_attribute('href')
-                full_url = f"https://web3.career{job_link}" if job_link.startswith('/') else job_link
-            except:
-                full_url = f"https://web3.career/front-end-jobs/{job_id}"
+            job_link = job_element.get('href')
+            if job_link:
+                full_url = self._BASE_URL + job_link if job_link.startswith('/') else job_link
+            else:
+                full_url = self._FALLBACK_PREFIX + job_id
 
+            posted = job_element.get('posted') or "Not specified"
+            
             return {
                 'id': job_id,
                 'title': title,
                 'company': company,
-                'location': location,
-                'salary': salary,
+                'location': job_element.get('location') or "Not specified",
+                'salary': job_element.get('salary') or "Not specified",
                 'posted': posted,
-                'tags': ', '.join(tags),
+                'tags': job_element.get('tags') or '',
                 'url': full_url,
-                'date_found': datetime.now().strftime("%Y-%m-%d")
+                'date_found': datetime.now().strftime("%Y-%m-%d"),
+                'days_ago': _days_ago(posted)
             }
 
         except Exception as e:
-            print(f"Error extracting job details: {str(e)}")
+            logger.exception("Error extracting job details")
             return None
     
-    def is_within_time_range(self, posted):
-        """Check if job was posted within the last 30 days"""
+    def is_within_time_range(self, days_ago):
+        """
+        Check if job was posted within the last 30 days.
+        
+        Args:
+            days_ago (int): Job age as parsed by extract_job_details
+            
+        Returns:
+            bool: True if the job is recent enough to keep
+        """
+        return days_ago <= 30
+    
+    def _row_posted(self, row):
+        """Get the posted time text of a job table row, or None"""
+        posted = row.find('time')
+        return posted.get_text(strip=True) if posted else None
+    
+    def _parse_row(self, row):
+        """
+        Collect the raw fields of a job table row.
+        
+        Args:
+            row (bs4.element.Tag): A tr[data-jobid] element
+            
+        Returns:
+            dict: Raw row fields consumed by extract_job_details
+        """
+        title = row.select_one('h2.fs-6.fs-md-5.fw-bold.my-primary')
+        company = row.select_one("h3[style*='font-size: 12px']")
+        cells = row.find_all('td')
+        location = (cells[3].select_one("span[style*='color: #d5d3d3'], a[style*='color: #d5d3d3']")
+                    if len(cells) > 3 else None)
+        salary = row.select_one("p[class*='text-salary']")
+        link = title.parent if title else None
+        
+        return {
+            'id': row.get('data-jobid'),
+            'element_id': row.get('id', ''),
+            'title': title.get_text(strip=True) if title else None,
+            'company': company.get_text(strip=True) if company else None,
+            'location': location.get_text(strip=True) if location else None,
+            'salary': salary.get_text('\n', strip=True).split('\n')[0] if salary else None,
+            'posted': self._row_posted(row),
+            'tags': ', '.join(filter(None, (a.get_text(strip=True) for a in
+                                            row.select('span.my-badge.my-badge-secondary a')))),
+            'href': link.get('href') if link else None
+        }
+    
+    def _page_url(self, base_url, page):
+        """Get the URL of a numbered listing page"""
+        return base_url if page == 1 else f"{base_url}?page={page}"
+    
+    def _get_cache_path(self, url):
+        """Get the cache file path for a URL, keyed by URL and today's date"""
+        key = f"{hashlib.sha1(url.encode()).hexdigest()}_{datetime.now().strftime('%Y-%m-%d')}"
+        return os.path.join(self.cache_dir, f"{key}.html.gz")
+    
+    def _load_from_cache(self, url):
+        """Return the cached HTML for a URL, or None if missing or stale"""
+        cache_path = self._get_cache_path(url)
         try:
-            days = int(posted.replace('d', ''))
-            return days <= 30
-        except:
-            return False
+            cache_time = datetime.fromtimestamp(os.path.getmtime(cache_path))
+            if datetime.now() - cache_time >= timedelta(hours=self.cache_duration_hours):
+                return None
+            with open(cache_path, 'rb') as f:
+                return gzip.decompress(f.read()).decode('utf-8')
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+    
+    def _save_to_cache(self, url, html):
+        """Store a page's HTML and evict the least recently written entries"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._get_cache_path(url), 'wb') as f:
+                f.write(gzip.compress(html.encode('utf-8')))
+            
+            entries = sorted(os.scandir(self.cache_dir), key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:-self.cache_max_entries]:
+                os.remove(entry.path)
+        except OSError as e:
+            logger.warning("Could not cache %s: %s", url, e)
+    
+    def _get_html(self, url, jitter=False):
+        """
+        Get a page's HTML from the disk cache, or download and cache it.
+        
+        Args:
+            url (str): Page URL
+            jitter (bool): Sleep briefly before a network request
+            
+        Returns:
+            str: The page HTML
+        """
+        if self.use_cache:
+            html = self._load_from_cache(url)
+            if html is not None:
+                logger.debug("Using cached copy of %s", url)
+                return html
+        
+        if jitter:
+            # Small jitter so parallel requests don't all land at once
+            self.human_like_delay(0, 1)
+        response = self.session.get(url, timeout=self._REQUEST_TIMEOUT)
+        response.raise_for_status()
+        
+        # Only cache real listing pages, so an interstitial or anti-bot page
+        # isn't served back in place of results on later runs
+        if 'data-jobid' in response.text:
+            self._save_to_cache(url, response.text)
+        return response.text
+    
+    def _load_page(self, url):
+        """Fetch a listing page and parse it into self.soup"""
+        self.soup = BeautifulSoup(self._get_html(url), 'lxml')
+    
+    def _fetch_page(self, url):
+        """
+        Fetch and parse a listing page, for use from worker threads.
+        
+        Returns:
+            BeautifulSoup: The parsed page, or None if it could not be fetched
+        """
+        try:
+            return BeautifulSoup(self._get_html(url, jitter=True), 'lxml')
+        except requests.exceptions.RequestException as e:
+            logger.error("Error loading %s: %s", url, e)
+            return None
     
     def _extract_jobs(self):
         """Extract all jobs from current page"""
         try:
-            print("Waiting for job listings to load...")
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "tr[data-jobid]"))
-            )
+            if self.soup is None:
+                return []
+            
+            rows = self.soup.select('tr[data-jobid]')
+            unseen_rows = [row for row in rows if row.get('data-jobid') not in self.seen_ids]
+            self.skipped_seen = len(rows) - len(unseen_rows)
             
-            self.human_like_delay(2, 3)
+            # Read just the posted time first so old listings are dropped
+            # before the rest of the row is parsed
+            recent_rows = [row for row in unseen_rows
+                           if self.is_within_time_range(_days_ago(self._row_posted(row)))]
             
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, "tr[data-jobid]")
-            print(f"Found {len(job_elements)} potential job listings on current page")
+            job_elements = [self._parse_row(row) for row in recent_rows]
+            logger.debug("Found %d recent job listings on current page (%d already known, %d outside time range)",
+                         len(job_elements), self.skipped_seen, len(unseen_rows) - len(recent_rows))
             
-            new_jobs = []
-            for job_element in job_elements:
-                job_details = self.extract_job_details(job_element)
-                if job_details and self.is_within_time_range(job_details['posted']):
-                    new_jobs.append(job_details)
+            new_jobs = [job for job in map(self.extract_job_details, job_elements) if job]
             
+            self.seen_ids.update(job['id'] for job in new_jobs)
             self.jobs_data.extend(new_jobs)
-            print(f"Successfully extracted {len(new_jobs)} jobs within time range")
+            logger.info("Successfully extracted %d jobs within time range", len(new_jobs))
             return new_jobs
             
         except Exception as e:
-            print(f"Error extracting jobs from page: {str(e)}")
+            logger.exception("Error extracting jobs from page")
             return []
     
     def has_next_page(self):
         """Check if there's a next page and get its URL"""
-        try:
-            next_link = self.driver.find_element(By.CSS_SELECTOR, "li.page-item.next:not(.disabled) a")
-            next_url = next_link.get_attribute('href')
-            return next_url
-        except:
+        if self.soup is None:
+            return None
+        
+        next_link = self.soup.select_one("li.page-item.next:not(.disabled) a[href]")
+        if not next_link:
             return None
+        
+        next_url = next_link['href']
+        return self._BASE_URL + next_url if next_url.startswith('/') else next_url
     
     def go_to_next_page(self, next_url):
         """Navigate to the next page"""
         try:
-            print(f"Navigating to next page: {next_url}")
-            self.driver.get(next_url)
-            self.human_like_delay(3, 5)
+            logger.debug("Navigating to next page: %s", next_url)
+            self.human_like_delay(0.2, 0.8)
+            self._load_page(next_url)
             return True
-        except:
-            return False
\ No newline at end of file
+        except requests.exceptions.RequestException as e:
+            logger.error("Error loading %s: %s", next_url, e)
+            return False
+    
+    def save_jobs(self):
+        """Save jobs newest first, using the days_ago computed at extraction"""
+        self.jobs_data.sort(key=itemgetter('days_ago'))
+        super().save_jobs()
+    
+    def run_job_search(self, remote_only=True, max_pages=5, login_credentials=None):
+        """
+        Run the job search over plain HTTP, without starting a browser.
+        
+        Args:
+            remote_only (bool): Whether to filter for remote jobs
+            max_pages (int): Maximum number of pages to process
+            login_credentials (dict): Unused, web3.career needs no login
+            
+        Returns:
+            list: The extracted job data
+        """
+        try:
+            self.seen_ids = self.db.get_all_job_ids(self.source_name.lower())
+            
+            base_url = self.get_base_url(remote_only)
+            logger.info("Fetching up to %d pages from: %s", max_pages, base_url)
+            
+            pages_processed = 0
+            total_jobs = 0
+            
+            with ThreadPoolExecutor(max_workers=self._MAX_PARALLEL_PAGES) as executor:
+                # Keep a small window of pages in flight ahead of the one being
+                # processed, so finding the end of the listings leaves at most
+                # a window's worth of requests unused
+                futures = {}
+                for page in range(1, min(self._MAX_PARALLEL_PAGES, max_pages) + 1):
+                    futures[page] = executor.submit(self._fetch_page, self._page_url(base_url, page))
+                
+                for page in range(1, max_pages + 1):
+                    self.soup = futures.pop(page).result()
+                    if self.soup is None:
+                        break
+                    
+                    logger.info("Processing page %d...", page)
+                    pages_processed = page
+                    new_jobs = self._extract_jobs()
+                    total_jobs += len(new_jobs)
+                    self.store_jobs(new_jobs)
+                    
+                    # A page of only already-known jobs doesn't mean the listings ended
+                    if not new_jobs and not self.skipped_seen:
+                        logger.info("No jobs found on this page")
+                        break
+                    if not self.has_next_page():
+                        logger.info("No more pages available")
+                        break
+                    
+                    ahead = page + self._MAX_PARALLEL_PAGES
+                    if ahead <= max_pages:
+                        futures[ahead] = executor.submit(self._fetch_page, self._page_url(base_url, ahead))
+                
+                for future in futures.values():
+                    future.cancel()
+            
+            logger.info("Total pages processed: %d", pages_processed)
+            logger.info("Total jobs found: %d", total_jobs)
+            
+            # Save to both CSV and database
+            self.save_jobs()
+            
+            return self.jobs_data
+            
+        except Exception as e:
+            logger.exception("Error during %s job search process", self.source_name)
+            return []
+            
+        finally:
+            self.cleanup()
@@ -0,0 +1,26 @@
+#!/usr/bin/env bash
+# Start a long-lived Chrome that the scrapers attach to instead of launching
+# their own browser on every run.
+#
+# Usage: ./launch_browser.sh
+# Then run the scrapers with CHROME_DEBUGGER_ADDRESS=127.0.0.1:<port> so they
+# attach to it. Override CHROME_BIN, DEBUG_PORT or PROFILE_DIR as needed.
+
+CHROME_BIN="${CHROME_BIN:-/Applications/Google Chrome Dev.app/Contents/MacOS/Google Chrome Dev}"
+DEBUG_PORT="${DEBUG_PORT:-9222}"
+PROFILE_DIR="${PROFILE_DIR:-/tmp/web3-bot-profile}"
+
+if [ ! -x "$CHROME_BIN" ]; then
+    for candidate in google-chrome-unstable google-chrome chromium chromium-browser; do
+        if command -v "$candidate" >/dev/null 2>&1; then
+            CHROME_BIN="$(command -v "$candidate")"
+            break
+        fi
+    done
+fi
+
+exec "$CHROME_BIN" \
+    --remote-debugging-port="$DEBUG_PORT" \
+    --user-data-dir="$PROFILE_DIR" \
+    --no-first-run \
+    --no-default-browser-check
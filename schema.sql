@@ -345,4 +345,5 @@ CREATE TABLE IF NOT EXISTS networking_events (
 CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(name);
 CREATE INDEX IF NOT EXISTS idx_outreach_contacts_email ON outreach_contacts(email);
 CREATE INDEX IF NOT EXISTS idx_outreach_messages_sent_date ON outreach_messages(sent_date);
-CREATE INDEX IF NOT EXISTS idx_messages_status ON outreach_messages(status);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_messages_status ON outreach_messages(status);
+CREATE INDEX IF NOT EXISTS idx_email_templates_name ON email_templates(name);
\ No newline at end of file
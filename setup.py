@@ -16,6 +16,14 @@ import subprocess
 import platform
 from datetime import datetime
 
+# Expected ChromeDriver location, shared by the install check and the Selenium test
+_CHROMEDRIVER_PATH = os.path.join(
+    "drivers", "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
+)
+
+# Touched after a successful `pip check`; newer than requirements.txt means nothing changed
+_PIP_CHECK_STAMP = ".setup_pip_ok"
+
 def print_banner():
     """Print welcome banner"""
     print("\n" + "=" * 80)
@@ -48,6 +56,14 @@ def check_pip_packages():
             print("❌ requirements.txt not found in current directory.")
             return False
         
+        # Skip the pip check if it already passed since requirements.txt last changed
+        try:
+            if os.stat(_PIP_CHECK_STAMP).st_mtime >= os.stat("requirements.txt").st_mtime:
+                print("✓ Required packages are properly installed (cached check).")
+                return True
+        except FileNotFoundError:
+            pass
+        
         # Run pip check to see if packages are installed
         process = subprocess.run(
             [sys.executable, "-m", "pip", "check"],
@@ -57,6 +73,7 @@ def check_pip_packages():
         
         # If pip check succeeded, packages are properly installed
         if process.returncode == 0:
+            open(_PIP_CHECK_STAMP, 'w').close()
             print("✓ Required packages are properly installed.")
             return True
         
@@ -75,12 +92,7 @@ def check_chromedriver():
     # Create the drivers directory if it doesn't exist
     os.makedirs("drivers", exist_ok=True)
     
-    # Determine expected ChromeDriver path
-    system = platform.system()
-    if system == "Windows":
-        chromedriver_path = os.path.join("drivers", "chromedriver.exe")
-    else:
-        chromedriver_path = os.path.join("drivers", "chromedriver")
+    chromedriver_path = _CHROMEDRIVER_PATH
     
     # Check if ChromeDriver exists
     if not os.path.exists(chromedriver_path):
@@ -91,7 +103,7 @@ def check_chromedriver():
         return False
     
     # On Unix-like systems, ensure ChromeDriver is executable
-    if system != "Windows":
+    if platform.system() != "Windows":
         try:
             subprocess.run(["chmod", "+x", chromedriver_path], check=True)
         except subprocess.CalledProcessError:
@@ -110,13 +122,6 @@ def test_selenium():
         from selenium import webdriver
         from selenium.webdriver.chrome.service import Service
         
-        # Determine ChromeDriver path
-        system = platform.system()
-        if system == "Windows":
-            chromedriver_path = os.path.join("drivers", "chromedriver.exe")
-        else:
-            chromedriver_path = os.path.join("drivers", "chromedriver")
-        
         # Configure ChromeDriver
         options = webdriver.ChromeOptions()
         options.add_argument('--headless')  # Run in headless mode for testing
@@ -124,7 +129,7 @@ def test_selenium():
         options.add_argument('--disable-dev-shm-usage')
         
         # Initialize Chrome
-        service = Service(chromedriver_path)
+        service = Service(_CHROMEDRIVER_PATH)
         driver = webdriver.Chrome(service=service, options=options)
         
         # Test with a simple navigation
@@ -176,7 +181,13 @@ def create_directories():
         "backups"  # For database backups
     ]
     
+    # One directory scan instead of a stat per target directory
+    existing = {entry.name for entry in os.scandir('.') if entry.is_dir()}
+    
     for directory in directories:
+        if directory in existing:
+            print(f"✓ Directory exists: {directory}")
+            continue
         try:
             os.makedirs(directory, exist_ok=True)
             print(f"✓ Created directory: {directory}")
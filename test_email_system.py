@@ -1,10 +1,10 @@
 # test_email_system.py
 
+import sys
 import unittest
 from database_manager import JobApplicationDB
 from email_manager import EmailManager
 from config import Config
-import os
 from datetime import datetime
 import warnings
 import urllib3
@@ -16,20 +16,20 @@ class TestEmailSystem(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test database and managers"""
-        # Use a test database file
-        cls.test_db_path = "test_job_applications.db"
+        # Use an in-memory database so tests never touch the disk
+        cls.test_db_path = ":memory:"
         cls.db = JobApplicationDB(db_path=cls.test_db_path)
         cls.email_manager = EmailManager(cls.db)
         cls.config = Config()
 
     def setUp(self):
         """Set up before each test"""
-        # Clear existing test data
-        self.db.conn.execute("DELETE FROM outreach_messages")
-        self.db.conn.execute("DELETE FROM email_templates")
-        self.db.conn.execute("DELETE FROM outreach_contacts")
-        self.db.conn.execute("DELETE FROM companies")
-        self.db.conn.commit()
+        # Clear existing test data in a single transaction
+        with self.db.conn:
+            self.db.conn.execute("DELETE FROM outreach_messages")
+            self.db.conn.execute("DELETE FROM email_templates")
+            self.db.conn.execute("DELETE FROM outreach_contacts")
+            self.db.conn.execute("DELETE FROM companies")
 
     def test_config_loading(self):
         """Test that configuration is properly loaded"""
@@ -44,7 +44,7 @@ class TestEmailSystem(unittest.TestCase):
         self.assertTrue(len(templates) > 0)
         
         # Check specific template exists
-        initial_template = next((t for t in templates if t['name'] == 'Initial Outreach'), None)
+        initial_template = self.db.get_email_template_by_name('Initial Outreach')
         self.assertIsNotNone(initial_template)
         self.assertIn(self.config.YOUR_NAME, initial_template['body'])
 
@@ -139,16 +139,17 @@ class TestEmailSystem(unittest.TestCase):
     def tearDownClass(cls):
         """Clean up after all tests"""
         cls.db.close()
-        # Remove test database
-        if os.path.exists(cls.test_db_path):
-            os.remove(cls.test_db_path)
 
-def run_email_tests():
-    """Run all email system tests"""
+def run_email_tests(failfast=False):
+    """Run all email system tests
+    
+    Output from passing tests is buffered and discarded; pass failfast=True
+    to stop at the first failure during development.
+    """
     print("\nTesting Email System...")
     suite = unittest.TestLoader().loadTestsFromTestCase(TestEmailSystem)
-    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    result = unittest.TextTestRunner(verbosity=1, buffer=True, failfast=failfast).run(suite)
     return result.wasSuccessful()
 
 if __name__ == '__main__':
-    run_email_tests()
\ No newline at end of file
+    run_email_tests(failfast='--failfast' in sys.argv)
\ No newline at end of file
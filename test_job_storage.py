@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for storing scraped jobs and parsing web3.career listing pages.
+
+Run with: pytest test_job_storage.py
+"""
+
+import sys
+
+import pytest
+from bs4 import BeautifulSoup
+
+from database_manager import JobApplicationDB
+
+
+LISTING_HTML = """
+<html><body><table>
+<tr data-jobid="101" id="job-101">
+  <td><a href="/senior-frontend-dev-acme/101"><h2 class="fs-6 fs-md-5 fw-bold my-primary">Senior Frontend Dev</h2></a>
+      <h3 style="font-size: 12px">Acme</h3></td>
+  <td></td>
+  <td><time>3d</time></td>
+  <td><span style="color: #d5d3d3">Remote</span><p class="text-salary">$100k - $150k<br>est</p></td>
+  <td><span class="my-badge my-badge-secondary"><a>react</a></span>
+      <span class="my-badge my-badge-secondary"><a>web3</a></span></td>
+</tr>
+<tr data-jobid="102" id="sponsor-102">
+  <td><h2 class="fs-6 fs-md-5 fw-bold my-primary">Sponsored listing</h2><h3 style="font-size: 12px">Ads Inc</h3></td>
+  <td></td><td><time>1d</time></td>
+</tr>
+<tr data-jobid="103" id="job-103">
+  <td><a href="/bootcamp/103"><h2 class="fs-6 fs-md-5 fw-bold my-primary">Web3 Developer Bootcamp</h2></a>
+      <h3 style="font-size: 12px">Academy</h3></td>
+  <td></td><td><time>2d</time></td>
+</tr>
+<tr data-jobid="104" id="job-104">
+  <td><a href="/old-job/104"><h2 class="fs-6 fs-md-5 fw-bold my-primary">Old Job</h2></a>
+      <h3 style="font-size: 12px">Oldco</h3></td>
+  <td></td><td><time>45d</time></td>
+</tr>
+<tr data-jobid="105" id="job-105">
+  <td><a href="/react-engineer/105"><h2 class="fs-6 fs-md-5 fw-bold my-primary">React Engineer</h2></a>
+      <h3 style="font-size: 12px">Betaco</h3></td>
+  <td></td><td><time>30d</time></td>
+</tr>
+</table></body></html>
+"""
+
+
+def make_job(job_id, **overrides):
+    """A scraped job dict as produced by the scrapers"""
+    job = {
+        'id': job_id,
+        'title': f'Frontend Developer {job_id}',
+        'company': 'Acme',
+        'location': 'Remote',
+        'salary': 'Not specified',
+        'posted': '2d',
+        'tags': 'react',
+        'url': f'https://example.com/jobs/{job_id}',
+        'date_found': '2024-01-01',
+    }
+    job.update(overrides)
+    return job
+
+
+@pytest.fixture
+def db():
+    """Empty in-memory job database"""
+    database = JobApplicationDB(":memory:")
+    yield database
+    database.close()
+
+
+def count_rows(db, table):
+    return db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_bulk_insert_creates_one_application_per_job(db):
+    """New jobs each get a single 'New' application"""
+    assert db.add_jobs_bulk([make_job('1'), make_job('2')], 'web3.career') == 2
+
+    assert count_rows(db, 'jobs') == 2
+    statuses = db.conn.execute("SELECT status FROM applications").fetchall()
+    assert statuses == [('New',), ('New',)]
+
+
+def test_bulk_upsert_updates_existing_job(db):
+    """Re-adding a known job updates it without a second application row"""
+    db.add_jobs_bulk([make_job('1', salary='Not specified')], 'web3.career')
+    db.add_jobs_bulk([make_job('1', salary='$120k')], 'web3.career')
+
+    assert count_rows(db, 'jobs') == 1
+    assert count_rows(db, 'applications') == 1
+    salary = db.conn.execute("SELECT salary FROM jobs WHERE job_source_id = '1'").fetchone()[0]
+    assert salary == '$120k'
+
+
+def test_bulk_insert_handles_duplicates_within_batch(db):
+    """A job repeated in one batch is stored once, keeping the last version"""
+    db.add_jobs_bulk([make_job('1', title='First'), make_job('1', title='Second')], 'web3.career')
+
+    assert db.conn.execute("SELECT title FROM jobs").fetchall() == [('Second',)]
+    assert count_rows(db, 'applications') == 1
+
+
+def test_same_id_from_different_sources_is_kept_separately(db):
+    """Job ids are only unique per source"""
+    db.add_jobs_bulk([make_job('1')], 'web3.career')
+    db.add_jobs_bulk([make_job('1')], 'indeed')
+
+    assert count_rows(db, 'jobs') == 2
+    assert count_rows(db, 'applications') == 2
+
+
+def test_get_all_job_ids_is_scoped_to_source(db):
+    """Stored ids are returned per source"""
+    db.add_jobs_bulk([make_job('1'), make_job('2')], 'web3.career')
+    db.add_jobs_bulk([make_job('3')], 'indeed')
+
+    assert db.get_all_job_ids('web3.career') == {'1', '2'}
+    assert db.get_all_job_ids('indeed') == {'3'}
+    assert db.get_all_job_ids('linkedin') == set()
+
+
+@pytest.fixture
+def scraper(db):
+    """web3.career scraper with the listing fixture loaded as its current page"""
+    from job_scrapers.web3_career import Web3CareerScraper
+
+    web3 = Web3CareerScraper(db_instance=db, use_cache=False)
+    web3.soup = BeautifulSoup(LISTING_HTML, 'lxml')
+    return web3
+
+
+def test_parse_row_reads_all_fields(scraper):
+    """A listing row is parsed into its raw fields"""
+    row = scraper.soup.select_one('tr[data-jobid="101"]')
+
+    assert scraper._row_posted(row) == '3d'
+    assert scraper._parse_row(row) == {
+        'id': '101',
+        'element_id': 'job-101',
+        'title': 'Senior Frontend Dev',
+        'company': 'Acme',
+        'location': 'Remote',
+        'salary': '$100k - $150k',
+        'posted': '3d',
+        'tags': 'react, web3',
+        'href': '/senior-frontend-dev-acme/101',
+    }
+
+
+def test_extract_jobs_filters_ads_bootcamps_and_old_jobs(scraper):
+    """Sponsored rows, bootcamp ads and jobs older than 30 days are dropped"""
+    jobs = scraper._extract_jobs()
+
+    assert [job['id'] for job in jobs] == ['101', '105']
+    assert jobs[0]['url'] == 'https://web3.career/senior-frontend-dev-acme/101'
+    assert jobs[0]['days_ago'] == 3
+    assert jobs[1]['days_ago'] == 30
+
+
+def test_extract_jobs_skips_seen_ids_on_rerun(scraper, db):
+    """Jobs already in the database are skipped when the page is seen again"""
+    db.add_jobs_bulk([make_job('101')], scraper.source_name.lower())
+    scraper.seen_ids = db.get_all_job_ids(scraper.source_name.lower())
+
+    jobs = scraper._extract_jobs()
+
+    assert [job['id'] for job in jobs] == ['105']
+    assert scraper.skipped_seen == 1
+    assert scraper._extract_jobs() == []
+    assert scraper.skipped_seen == 2
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -13,6 +13,8 @@ try:
     import csv
     import os
     import sys
+    import contextlib
+    import importlib.util
     from datetime import datetime
     print("   [OK] Basic Python modules imported successfully")
 except Exception as e:
@@ -21,26 +23,16 @@ except Exception as e:
 
 # Test 2: Required third-party packages
 print("\n2. Testing required packages...")
-packages_to_test = [
-    'requests',
-    'json',
-    'csv',
-    'datetime'
-]
+REQUIRED_PACKAGES = ('requests', 'json', 'csv', 'datetime')
 
-for package in packages_to_test:
-    try:
-        if package == 'requests':
-            import requests
-        elif package == 'json':
-            import json  
-        elif package == 'csv':
-            import csv
-        elif package == 'datetime':
-            from datetime import datetime
+# Check every package so all missing ones are reported, not just the first
+packages_ok = True
+for package in REQUIRED_PACKAGES:
+    if importlib.util.find_spec(package) is None:
+        print(f"   [ERROR] {package}: No module named '{package}'")
+        packages_ok = False
+    else:
         print(f"   [OK] {package}")
-    except ImportError as e:
-        print(f"   [ERROR] {package}: {e}")
 
 # Test 3: API Usage Manager
 print("\n3. Testing API Usage Manager...")
@@ -48,7 +40,7 @@ try:
     from job_scrapers.api_usage_manager import APIUsageManager
     
     # Initialize manager
-    manager = APIUsageManager("test_usage.json")
+    manager = APIUsageManager("test_usage.json", autosave=False)
     
     # Test basic functionality
     can_use_jsearch = manager.can_use_api('jsearch', 1)
@@ -61,9 +53,9 @@ try:
     priority = manager.classify_query_priority("senior react developer")
     print(f"   [OK] Query classification: 'senior react developer' -> {priority}")
     
-    # Cleanup
-    if os.path.exists("test_usage.json"):
-        os.remove("test_usage.json")
+    # Nothing is written with autosave off; just clear any leftover test file
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink("test_usage.json")
         
     print("   [OK] API Usage Manager working correctly")
 except Exception as e:
@@ -75,12 +67,11 @@ try:
     from job_scrapers.scraper_factory import JobScraperFactory
     
     # Get available scrapers
-    scrapers = JobScraperFactory.get_available_scrapers()
-    api_scrapers = [k for k, v in scrapers.items() if v.get('type') == 'api']
-    web_scrapers = [k for k, v in scrapers.items() if v.get('type') == 'web']
+    api_scrapers = JobScraperFactory.get_api_scrapers()
+    web_scrapers = JobScraperFactory.get_web_scrapers()
     
-    print(f"   [OK] Found {len(api_scrapers)} API scrapers: {', '.join(api_scrapers)}")
-    print(f"   [OK] Found {len(web_scrapers)} web scrapers: {', '.join(web_scrapers)}")
+    print(f"   [OK] Found {len(api_scrapers)} API scrapers: {', '.join(sorted(api_scrapers))}")
+    print(f"   [OK] Found {len(web_scrapers)} web scrapers: {', '.join(sorted(web_scrapers))}")
     
     # Test platform coverage
     coverage = JobScraperFactory.get_platforms_covered()
@@ -116,18 +107,22 @@ try:
         {'title': 'Frontend Engineer', 'company': 'Web Co', 'location': 'New York'}
     ]
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        fieldnames = test_data[0].keys()
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(test_data)
+    fieldnames = ('title', 'company', 'location')
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', newline='', delete=False) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([tuple(d[field] for field in fieldnames) for d in test_data])
         temp_filename = f.name
     
     # Test CSV reading
-    with open(temp_filename, 'r') as f:
-        reader = csv.DictReader(f)
+    with open(temp_filename, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        column_index = {name: i for i, name in enumerate(header)}
         rows = list(reader)
     
+    assert rows[0][column_index['title']] == test_data[0]['title']
+    
     os.unlink(temp_filename)
     
     print(f"   [OK] CSV export/import working: {len(rows)} rows processed")
@@ -153,4 +148,7 @@ print("   RAPIDAPI_KEY=your_rapidapi_key")
 print("3. Test: python job_scraper_cli.py --quota-status")
 print("4. Search: python job_scraper_cli.py --apis-only --query \"react developer\"")
 
-print("\nSystem is ready for Windows!")
\ No newline at end of file
+if packages_ok:
+    print("\nSystem is ready for Windows!")
+else:
+    print("\nInstall the missing packages listed in step 2 before running the bot.")
\ No newline at end of file
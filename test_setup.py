@@ -1,35 +1,103 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+# Selenium, webdriver_manager and dotenv are imported where they're used so
+# skipped checks don't pay their import cost
 # import pandas as pd  # Removed to avoid Windows compatibility issues
 import os
-from dotenv import load_dotenv
+import sys
+import json
+import datetime
+import time
 import socket
+import functools
 import warnings
 import urllib3
 
 # Suppress the SSL warning
 warnings.filterwarnings('ignore', category=urllib3.exceptions.NotOpenSSLWarning)
 
+# A successful connectivity check is remembered across runs for a short while
+_NET_OK_STAMP = os.path.join(os.path.expanduser('~'), '.cache', 'job_bot_net_ok')
+_NET_OK_TTL = 60  # seconds
+
+@functools.lru_cache(maxsize=1)
 def check_internet():
     try:
-        socket.create_connection(("8.8.8.8", 53), timeout=3)
-        return True
+        if time.time() - os.path.getmtime(_NET_OK_STAMP) < _NET_OK_TTL:
+            return True
+    except OSError:
+        pass
+    
+    try:
+        with socket.create_connection(("1.1.1.1", 53), timeout=1):
+            pass
     except OSError:
         return False
+    
+    try:
+        os.makedirs(os.path.dirname(_NET_OK_STAMP), exist_ok=True)
+        with open(_NET_OK_STAMP, 'a'):
+            os.utime(_NET_OK_STAMP)
+    except OSError:
+        pass
+    return True
+
+# webdriver_manager only trusts a cached driver for this many days before
+# checking the installed browser's version again
+DRIVER_CACHE_VALID_DAYS = 1
 
-def test_setup():
+def _is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+def find_cached_chromedriver():
+    """Return an already available chromedriver path, or None on cache miss"""
+    env_path = os.environ.get('CHROMEDRIVER_PATH')
+    if _is_executable(env_path):
+        return env_path
+    
+    # webdriver_manager records each downloaded driver's binary path and
+    # download date in ~/.wdm/drivers.json
+    drivers_json = os.path.join(os.path.expanduser('~'), '.wdm', 'drivers.json')
+    try:
+        with open(drivers_json, 'r') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    today = datetime.date.today()
+    candidates = []
+    for key, info in metadata.items():
+        if 'chromedriver' not in key or not isinstance(info, dict):
+            continue
+        try:
+            downloaded = datetime.datetime.strptime(info.get('timestamp', ''), '%d/%m/%Y').date()
+        except ValueError:
+            continue
+        path = info.get('binary_path')
+        # Older drivers may no longer match the browser, so leave them to
+        # webdriver_manager's version check
+        if (today - downloaded).days < DRIVER_CACHE_VALID_DAYS and _is_executable(path):
+            candidates.append((downloaded, path))
+    
+    return max(candidates)[1] if candidates else None
+
+def test_setup(run_selenium=False):
     print("Testing installations...")
     
-    # Check internet connection first
-    internet_available = check_internet()
-    if not internet_available:
-        print("⚠️  Warning: No internet connection detected. Selenium test will be skipped.")
+    internet_available = True
+    if run_selenium:
+        # Check internet connection first
+        internet_available = check_internet()
+        if not internet_available:
+            print("⚠️  Warning: No internet connection detected. Selenium test will be skipped.")
+    else:
+        print("Skipping Selenium test (run with --selenium to include it)")
     
-    # Test selenium and chrome driver only if internet is available
-    if internet_available:
+    # Test selenium and chrome driver only if requested and internet is available
+    if run_selenium and internet_available:
         try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.service import Service
+            from selenium.webdriver.chrome.options import Options
+            
             chrome_options = Options()
             chrome_options.binary_location = "/Applications/Google Chrome Dev.app/Contents/MacOS/Google Chrome Dev"
             chrome_options.add_argument('--no-sandbox')
@@ -38,8 +106,13 @@ def test_setup():
             chrome_options.add_argument('--disable-gpu')
             
             # Removed timeout parameter
+            # Only ask webdriver_manager to resolve/download a driver on cache miss
+            driver_path = find_cached_chromedriver()
+            if driver_path is None:
+                from webdriver_manager.chrome import ChromeDriverManager
+                driver_path = ChromeDriverManager(chrome_type="chrome-dev").install()
             service = Service(
-                ChromeDriverManager(chrome_type="chrome-dev").install(),
+                driver_path,
                 service_args=['--verbose']
             )
             
@@ -65,13 +138,14 @@ def test_setup():
     
     # Test dotenv (works offline)
     try:
+        from dotenv import load_dotenv
         load_dotenv()
         print("✓ python-dotenv setup successful")
     except Exception as e:
         print("✗ python-dotenv setup failed:", str(e))
     
-    if not internet_available:
+    if run_selenium and not internet_available:
         print("\nNote: Run this script again when you have a better internet connection to test Selenium setup.")
 
 if __name__ == "__main__":
-    test_setup()
\ No newline at end of file
+    test_setup(run_selenium='--selenium' in sys.argv)
\ No newline at end of file
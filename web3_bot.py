@@ -6,33 +6,39 @@ This script is maintained for backward compatibility.
 For newer multi-platform functionality, use job_scraper_cli.py
 """
 
-import sys
+import argparse
+import logging
+import os
 from job_scrapers.web3_career import Web3CareerScraper
 
 def main():
     """Main entry point for web3.career scraper"""
-    print("Starting Web3 career job search...")
-    print("Note: For multi-platform support, consider using job_scraper_cli.py instead")
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(), format='%(message)s')
     
     # Parse command-line arguments
-    remote_only = True
-    max_pages = 5
+    parser = argparse.ArgumentParser(description='Scrape job listings from web3.career')
+    parser.add_argument('--include-onsite', action='store_true',
+                        help='Include onsite jobs as well as remote ones')
+    parser.add_argument('--pages', type=int, default=5,
+                        help='Maximum number of result pages to process (default: 5)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Download every page again instead of reusing pages cached today')
+    args = parser.parse_args()
+    if args.pages < 1:
+        parser.error("--pages must be at least 1")
+    
+    print("Starting Web3 career job search...")
+    print("Note: For multi-platform support, consider using job_scraper_cli.py instead")
     
-    if len(sys.argv) > 1:
-        if '--include-onsite' in sys.argv:
-            remote_only = False
-            print("Including onsite jobs")
-            
-        for i, arg in enumerate(sys.argv):
-            if arg == '--pages' and i+1 < len(sys.argv):
-                try:
-                    max_pages = int(sys.argv[i+1])
-                    print(f"Setting max pages to {max_pages}")
-                except ValueError:
-                    pass
+    remote_only = not args.include_onsite
+    max_pages = args.pages
+    if args.include_onsite:
+        print("Including onsite jobs")
+    if max_pages != 5:
+        print(f"Setting max pages to {max_pages}")
     
     # Run the web3.career scraper
-    scraper = Web3CareerScraper()
+    scraper = Web3CareerScraper(use_cache=not args.no_cache)
     jobs = scraper.run_job_search(remote_only=remote_only, max_pages=max_pages)
     
     print(f"\nFound {len(jobs)} jobs from web3.career")